@@ -5,13 +5,22 @@ Usage: python keltner_channel_1min.py --symbol BTC
 """
 import argparse
 import json
+import math
 import sys
 import time
-import datetime
 
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
 def normalize_symbol(symbol_input: str) -> str:
     s = symbol_input.strip().upper()
     if not s:
@@ -27,6 +36,14 @@ def normalize_symbol(symbol_input: str) -> str:
     # If user provided full symbol already (e.g., ETHUSDT), just return uppercase
     return s
 
+def smooth_last(values, alpha: float, seed: float) -> float:
+    """Apply s = alpha * x + (1 - alpha) * s over values starting from seed; return the final s."""
+    beta = 1.0 - alpha
+    s = seed
+    for x in values:
+        s = alpha * x + beta * s
+    return s
+
 def fetch_klines_with_retry(client: Client, symbol: str, interval: str, limit: int, retries: int = 1):
     for attempt in range(retries + 1):
         try:
@@ -101,11 +118,8 @@ def main():
         print("Insufficient data for EMA(20). Need at least 20 closes.")
         sys.exit(1)
     alpha_ema = 2.0 / (20.0 + 1.0)
-    sma20 = sum(closes[0:20]) / 20.0
-    ema20 = sma20
-    for i in range(20, n):
-        ema20 = alpha_ema * closes[i] + (1 - alpha_ema) * ema20
-    middle = ema20
+    sma20 = math.fsum(closes[:20]) / 20.0
+    middle = smooth_last(closes[20:], alpha_ema, sma20)
 
     # ATR(10)
     if n <= 10:
@@ -113,21 +127,19 @@ def main():
         sys.exit(1)
     alpha_atr = 2.0 / (10.0 + 1.0)
     # Seed ATR with SMA of TR[1]..TR[10]
-    initial_tr_values = [TR[i] for i in range(1, min(n, 11))]  # includes indices 1..10 if available
+    initial_tr_values = TR[1:11]  # indices 1..10 if available
     if len(initial_tr_values) < 10:
         print("Insufficient TR data to seed ATR(10).")
         sys.exit(1)
-    atr = sum(initial_tr_values) / 10.0
+    atr = math.fsum(initial_tr_values) / 10.0
     # Propagate ATR to the latest bar
-    for i in range(11, n):
-        atr = alpha_atr * TR[i] + (1 - alpha_atr) * atr
-    atr_latest = atr
+    atr_latest = smooth_last(TR[11:], alpha_atr, atr)
 
     upper = middle + args.multiplier * atr_latest
     lower = middle - args.multiplier * atr_latest
 
     latest_time_ms = int(open_times[-1])
-    iso_time = datetime.datetime.utcfromtimestamp(latest_time_ms / 1000.0).strftime("%Y-%m-%d %H:%M:%S")
+    iso_time = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(latest_time_ms // 1000))
 
     result = {
         "symbol": sym,
@@ -141,7 +153,7 @@ def main():
     }
 
     # Machine-readable JSON
-    print(json.dumps(result, indent=2))
+    print(_dumps(result))
 
     # Human-friendly concise line
     print(f"{sym} 1m: Middle={middle:.6f}, Upper={upper:.6f}, Lower={lower:.6f}")
@@ -13,7 +13,7 @@ Notes:
 import argparse
 import sys
 import math
-from datetime import datetime
+import time
 from binance.client import Client
 
 # Defaults for Klinger's Oscillator computation
@@ -23,8 +23,7 @@ KO_SLOW = 55        # Slow EMA for KO
 KL_DATA_LIMIT = 500   # Number of 1m candles to fetch (max 500 as per requirement)
 
 def ms_to_iso(ts_ms: int) -> str:
-    dt = datetime.utcfromtimestamp(ts_ms / 1000.0)
-    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts_ms // 1000))
 
 def compute_klinger_oscillator(klines, kl_period=KL_PERIOD, fast=KO_FAST, slow=KO_SLOW):
     """
@@ -35,57 +34,30 @@ def compute_klinger_oscillator(klines, kl_period=KL_PERIOD, fast=KO_FAST, slow=K
     if len(klines) < 2:
         return None, None
 
-    closes = []
-    volumes = []
-    times = []
-
-    # Extract close prices, volumes, and close times
-    for k in klines:
-        closes.append(float(k[4]))
-        volumes.append(float(k[5]))
-        times.append(int(k[6]))  # Close time in ms
-
-    # Build VW Price Change series: VWPC_i = Volume_i * (Close_i - Close_{i-1})
-    vwp = []
-    for i in range(1, len(closes)):
-        price_change = closes[i] - closes[i - 1]
-        vwp.append(volumes[i] * price_change)
-
-    if len(vwp) == 0:
-        return None, None
-
-    # EMA of VWPC to form Klinger's Line KL
-    kl_values = []
     alpha_kl = 2.0 / (kl_period + 1.0)
-    kl_ema = vwp[0]  # seed with first VWPC
-    kl_values.append(kl_ema)
-    for idx in range(1, len(vwp)):
-        kl_ema = kl_ema + alpha_kl * (vwp[idx] - kl_ema)
-        kl_values.append(kl_ema)
-
-    # KO: EMA of KL with fast and slow windows
-    ko_values = []
-    ema_fast = None
-    ema_slow = None
     alpha_fast = 2.0 / (fast + 1.0)
     alpha_slow = 2.0 / (slow + 1.0)
-    for klv in kl_values:
-        if ema_fast is None:
-            ema_fast = klv
-            ema_slow = klv
-        else:
-            ema_fast = ema_fast + alpha_fast * (klv - ema_fast)
-            ema_slow = ema_slow + alpha_slow * (klv - ema_slow)
-        ko = ema_fast - ema_slow
-        ko_values.append(ko)
 
-    if not ko_values:
-        return None, None
+    # Single pass: VWPC_i = Volume_i * (Close_i - Close_{i-1}) feeds KL = EMA(VWPC),
+    # which in turn feeds the fast and slow EMAs; only the running values are kept.
+    prev_close = float(klines[0][4])
+    kl_ema = ema_fast = ema_slow = None
+    for k in klines[1:]:
+        close = float(k[4])
+        vwpc = float(k[5]) * (close - prev_close)
+        prev_close = close
+        if kl_ema is None:
+            # seed KL with the first VWPC, and both KO EMAs with the first KL
+            kl_ema = ema_fast = ema_slow = vwpc
+        else:
+            kl_ema = kl_ema + alpha_kl * (vwpc - kl_ema)
+            ema_fast = ema_fast + alpha_fast * (kl_ema - ema_fast)
+            ema_slow = ema_slow + alpha_slow * (kl_ema - ema_slow)
 
-    latest_ko = ko_values[-1]
-    latest_time_ms = times[-1]  # corresponding to the last kline's CloseTime
+    latest_ko = ema_fast - ema_slow
+    latest_time_ms = int(klines[-1][6])  # corresponding to the last kline's CloseTime
 
-    if latest_ko is None or not isinstance(latest_ko, float) or not math.isfinite(latest_ko):
+    if not math.isfinite(latest_ko):
         return None, None
 
     return latest_ko, latest_time_ms
@@ -124,7 +96,7 @@ def resolve_symbol_and_fetch(client, input_symbol, limit=KL_DATA_LIMIT):
     return None, None
 
 def main():
-    parser = argparse.ArgumentParser(description='Fetch Klinger's Oscillator (KO) for a given symbol on 1-minute candles from Binance.')
+    parser = argparse.ArgumentParser(description="Fetch Klinger's Oscillator (KO) for a given symbol on 1-minute candles from Binance.")
     parser.add_argument('--symbol', required=True, help='Trading symbol (e.g., BTCUSDT or BTC)')
     args = parser.parse_args()
 
@@ -24,7 +24,6 @@ Error handling:
 import argparse
 import sys
 import time
-from datetime import datetime
 from typing import List, Optional
 
 from binance.client import Client
@@ -62,14 +61,37 @@ def fetch_klines_with_backoff(symbol: str, retries: int = 3, backoff_base: float
     sys.exit(1)
 
 
-def compute_sma_from_roc(roc_list: List[Optional[float]], t: int, S: int) -> Optional[float]:
-    start = t - S + 1
-    if start < 0:
-        return None
-    window = roc_list[start : t + 1]
-    if any(v is None for v in window):
-        return None
-    return sum(window) / S
+def compute_roc(closes: List[float], P: int) -> List[Optional[float]]:
+    """ROC(P) in percent aligned to closes; None for the first P bars and zero denominators."""
+    head: List[Optional[float]] = [None] * min(P, len(closes))
+    return head + [
+        ((c - d) / d) * 100.0 if d else None
+        for c, d in zip(closes[P:], closes)
+    ]
+
+
+def rolling_sma(values: List[Optional[float]], S: int) -> List[Optional[float]]:
+    """
+    SMA(S) aligned to values, maintained as a running sum (O(1) per bar).
+    A bar is None while its window still contains a None value.
+    """
+    out: List[Optional[float]] = [None] * len(values)
+    total = 0.0
+    missing = 0
+    for t, v in enumerate(values):
+        if v is None:
+            missing += 1
+        else:
+            total += v
+        if t >= S:
+            old = values[t - S]
+            if old is None:
+                missing -= 1
+            else:
+                total -= old
+        if t >= S - 1 and missing == 0:
+            out[t] = total / S
+    return out
 
 
 def main():
@@ -97,15 +119,13 @@ def main():
         print("Error: No klines returned from Binance API.", file=sys.stderr)
         sys.exit(1)
 
-    # Extract closes and times
+    # Extract closes and the latest open time
     closes = []
-    times_utc = []
     try:
         for k in klines:
             close_price = float(k[4])
             closes.append(close_price)
-            open_time_ms = int(k[0])
-            times_utc.append(datetime.utcfromtimestamp(open_time_ms / 1000.0))
+        latest_open_ms = int(klines[-1][0])
     except (ValueError, TypeError, IndexError) as e:
         print(f"Error parsing klines data: {e}", file=sys.stderr)
         sys.exit(1)
@@ -121,40 +141,16 @@ def main():
     weights = [1, 2, 3, 4]
 
     # Compute ROC arrays
-    roc10 = [None] * N
-    roc15 = [None] * N
-    roc20 = [None] * N
-    roc30 = [None] * N
-
-    for t in range(N):
-        if t >= 10:
-            denom = closes[t - 10]
-            if denom != 0:
-                roc10[t] = ((closes[t] - denom) / denom) * 100.0
-        if t >= 15:
-            denom = closes[t - 15]
-            if denom != 0:
-                roc15[t] = ((closes[t] - denom) / denom) * 100.0
-        if t >= 20:
-            denom = closes[t - 20]
-            if denom != 0:
-                roc20[t] = ((closes[t] - denom) / denom) * 100.0
-        if t >= 30:
-            denom = closes[t - 30]
-            if denom != 0:
-                roc30[t] = ((closes[t] - denom) / denom) * 100.0
+    roc10 = compute_roc(closes, 10)
+    roc15 = compute_roc(closes, 15)
+    roc20 = compute_roc(closes, 20)
+    roc30 = compute_roc(closes, 30)
 
     # Compute SMAs for each ROC
-    sma10 = [None] * N
-    sma15 = [None] * N
-    sma20 = [None] * N
-    sma30 = [None] * N
-
-    for t in range(N):
-        sma10[t] = compute_sma_from_roc(roc10, t, 10)
-        sma15[t] = compute_sma_from_roc(roc15, t, 10)
-        sma20[t] = compute_sma_from_roc(roc20, t, 15)
-        sma30[t] = compute_sma_from_roc(roc30, t, 15)
+    sma10 = rolling_sma(roc10, 10)
+    sma15 = rolling_sma(roc15, 10)
+    sma20 = rolling_sma(roc20, 15)
+    sma30 = rolling_sma(roc30, 15)
 
     # Compute KST with weights
     kst = [None] * N
@@ -171,12 +167,7 @@ def main():
             )
 
     # Compute signal line SMA(KST, 9)
-    signal = [None] * N
-    for t in range(N):
-        if t >= min_t_for_kst + 9 - 1:  # 44 + 8 = 52
-            window = [kst[i] for i in range(t - 9, t + 1) if kst[i] is not None]
-            if len(window) == 9:
-                signal[t] = sum(window) / 9.0
+    signal = rolling_sma(kst, 9)
 
     # Compute Histogram
     histogram = [None] * N
@@ -186,7 +177,7 @@ def main():
 
     # Output latest values
     last_index = N - 1
-    latest_time = times_utc[last_index].strftime("%Y-%m-%d %H:%M")
+    latest_time = time.strftime("%Y-%m-%d %H:%M", time.gmtime(latest_open_ms // 1000))
 
     latest_kst = kst[last_index]
     latest_signal = signal[last_index]
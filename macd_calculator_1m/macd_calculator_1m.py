@@ -11,9 +11,17 @@ Notes:
 
 import argparse
 import sys
+import time
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
-from datetime import datetime
+
+# Smoothing factors for the fixed MACD(12, 26, 9) spans
+_K12 = 2.0 / (12 + 1)
+_K26 = 2.0 / (26 + 1)
+_K9 = 2.0 / (9 + 1)
+_R12 = 1 - _K12
+_R26 = 1 - _K26
+_R9 = 1 - _K9
 
 def map_symbol_to_pair(symbol: str) -> str:
     s = symbol.upper()
@@ -21,26 +29,24 @@ def map_symbol_to_pair(symbol: str) -> str:
         return s
     return f"{s}USDT"
 
-def ema(values, period: int):
-    if not values or period <= 0:
-        return []
-    k = 2.0 / (period + 1)
-    result = []
-    for i, v in enumerate(values):
-        if i == 0:
-            result.append(v)
-        else:
-            result.append(v * k + result[-1] * (1 - k))
-    return result
-
 def compute_macd(closes):
+    """MACD(12, 26, 9) in a single pass, equivalent to chaining three seeded EMAs."""
     if not closes or len(closes) < 26:
         return None
-    ema12 = ema(closes, 12)
-    ema26 = ema(closes, 26)
-    macd_line = [a - b for a, b in zip(ema12, ema26)]
-    signal_line = ema(macd_line, 9)
-    histogram = [m - s for m, s in zip(macd_line, signal_line)]
+    fast = slow = closes[0]
+    signal = 0.0
+    macd_line = []
+    signal_line = []
+    histogram = []
+    for i, v in enumerate(closes):
+        if i:
+            fast = v * _K12 + fast * _R12
+            slow = v * _K26 + slow * _R26
+        m = fast - slow
+        signal = m if i == 0 else m * _K9 + signal * _R9
+        macd_line.append(m)
+        signal_line.append(signal)
+        histogram.append(m - signal)
     return macd_line, signal_line, histogram
 
 def main():
@@ -73,7 +79,7 @@ def main():
         last_idx = len(macd_line) - 1
         # Time of last candle
         last_close_time_ms = int(klines[-1][6])
-        time_str = datetime.utcfromtimestamp(last_close_time_ms / 1000.0).strftime("%Y-%m-%dT%H:%M:%SZ")
+        time_str = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(last_close_time_ms // 1000))
 
         print(f"Symbol: {pair}, Interval: 1m, Time: {time_str}")
         print(f"MACD: {macd_line[last_idx]:.5f}, SIGNAL: {signal_line[last_idx]:.5f}, HIST: {histogram[last_idx]:.5f}")
@@ -25,22 +25,32 @@ import argparse
 import sys
 import json
 import math
-from datetime import datetime
+import time
 from binance.client import Client
 
-def compute_ema(series, window):
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
+def ema_last(series, window):
     """
-    Compute EMA for a given series and window.
-    alpha = 2 / (window + 1)
-    Returns a list of EMA values of same length as input series.
+    Compute the latest EMA value for a given series and window.
+    alpha = 2 / (window + 1), seeded with the first value.
+    Only the final value is kept; no intermediate series is built.
     """
     if not series or window <= 0:
-        return []
+        return None
     alpha = 2.0 / (window + 1)
-    emas = [series[0]]
+    beta = 1.0 - alpha
+    ema = series[0]
     for v in series[1:]:
-        emas.append(alpha * v + (1 - alpha) * emas[-1])
-    return emas
+        ema = alpha * v + beta * ema
+    return ema
 
 def main():
     parser = argparse.ArgumentParser(description="Mass Index on 1-minute candles (EMA of high-low range)")
@@ -97,12 +107,9 @@ def main():
     fast_n = 9
     slow_n = 26
 
-    fast_ema = compute_ema(ranges, fast_n)
-    slow_ema = compute_ema(ranges, slow_n)
-
     last_idx = len(ranges) - 1
-    last_fast = fast_ema[last_idx]
-    last_slow = slow_ema[last_idx]
+    last_fast = ema_last(ranges, fast_n)
+    last_slow = ema_last(ranges, slow_n)
 
     # Avoid division by zero
     if last_slow == 0:
@@ -112,9 +119,9 @@ def main():
 
     # Time formatting
     t_last = times_ms[last_idx]
-    dt = datetime.utcfromtimestamp(t_last / 1000.0)
-    time_str = dt.strftime('%Y-%m-%d %H:%M:%S')
-    time_iso = dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    tm = time.gmtime(t_last // 1000)
+    time_str = time.strftime('%Y-%m-%d %H:%M:%S', tm)
+    time_iso = time.strftime('%Y-%m-%dT%H:%M:%SZ', tm)
 
     mass_str = f"{mass_val:.4f}" if not math.isnan(mass_val) else "NaN"
 
@@ -130,7 +137,7 @@ def main():
         "fast_ema": last_fast,
         "slow_ema": last_slow
     }
-    print(json.dumps(json_out))
+    print(_dumps(json_out))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,6 +10,15 @@ import datetime
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
 # Number of periods for MFI calculation (N in the algorithm)
 N = 14
 
@@ -36,18 +45,18 @@ def main():
         klines = client.get_klines(symbol=pair, interval=Client.KLINE_INTERVAL_1MINUTE, limit=limit)
     except BinanceAPIException as e:
         code = getattr(e, 'code', None)
-        print(json.dumps(build_error_payload(str(e), code)))
+        print(_dumps(build_error_payload(str(e), code)))
         raise SystemExit(1)
     except BinanceRequestException as e:
-        print(json.dumps(build_error_payload(str(e))))
+        print(_dumps(build_error_payload(str(e))))
         raise SystemExit(1)
     except Exception as e:
-        print(json.dumps(build_error_payload(str(e))))
+        print(_dumps(build_error_payload(str(e))))
         raise SystemExit(1)
 
     if not klines or len(klines) < limit:
         msg = f"Not enough klines returned. Expected {limit}, got {len(klines) if klines else 0}."
-        print(json.dumps(build_error_payload(msg)))
+        print(_dumps(build_error_payload(msg)))
         raise SystemExit(1)
 
     # Build TP and MF arrays
@@ -61,7 +70,7 @@ def main():
             close = float(k[4])
             vol = float(k[5])
         except (ValueError, TypeError) as e:
-            print(json.dumps(build_error_payload(f"Invalid candle data: {e}")))
+            print(_dumps(build_error_payload(f"Invalid candle data: {e}")))
             raise SystemExit(1)
 
         tp = (high + low + close) / 3.0
@@ -107,7 +116,7 @@ def main():
             "status": "success"
         }
 
-    print(json.dumps(output))
+    print(_dumps(output))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -14,8 +14,10 @@ Notes:
 """
 
 import argparse
+import math
 import sys
 import time
+from operator import itemgetter
 from datetime import datetime
 from binance.client import Client
 
@@ -73,15 +75,11 @@ def main():
         sys.exit(1)
 
     # Extract closes and validate data
-    closes = []
     try:
-        for idx, k in enumerate(klines):
-            # k is a list: [ OpenTime, Open, High, Low, Close, Volume, CloseTime, ... ]
-            close_str = k[4]
-            close_val = float(close_str)
-            closes.append(close_val)
+        # k is a list: [ OpenTime, Open, High, Low, Close, Volume, CloseTime, ... ]
+        closes = list(map(float, map(itemgetter(4), klines)))
         # Ensure numeric data integrity
-        if any(v != v for v in closes):  # NaN check
+        if any(map(math.isnan, closes)):
             raise ValueError("Non-numeric close data encountered.")
     except Exception as e:
         print(f"Fatal: Non-numeric or invalid close data encountered: {e}", file=sys.stderr)
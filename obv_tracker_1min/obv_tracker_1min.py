@@ -8,16 +8,19 @@ Notes:
   - Uses python-binance (from binance.client import Client)
   - No authentication: Client("", "")
   - Persists state to obv_<symbol>.state.json to survive restarts
-  - If a data gap > 1 minute is detected, the script exits with an error
+  - Closed candles the stream skipped are backfilled over REST; any other data gap > 1 minute
+    exits with an error
+  - After the initial REST sync, closed candles are followed on the kline WebSocket
 """
 
 import argparse
 import json
 import os
 import sys
-import time
+import threading
 from datetime import datetime, timezone
 
+from binance import ThreadedWebsocketManager
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
@@ -50,9 +53,11 @@ def format_time(ts_ms: int) -> str:
 
 
 def save_state(state_path: str, state: dict) -> None:
+    tmp_path = state_path + ".tmp"
     try:
-        with open(state_path, "w") as f:
-            json.dump(state, f)
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(state, separators=(",", ":")))
+        os.replace(tmp_path, state_path)
     except Exception as e:
         print(f"WARNING: Failed to save state to {state_path}: {e}", file=sys.stderr)
 
@@ -71,10 +76,11 @@ def load_state(state_path: str) -> dict | None:
 def print_line(symbol: str, ts_open_ms: int, obv: float, delta: float) -> None:
     ts_str = format_time(ts_open_ms)
     line = f"symbol={symbol} | time={ts_str} | OBV={obv} | delta={delta}"
-    print(line, flush=True)
     # Optional JSON-like line for easy parsing
     json_line = json.dumps({"symbol": symbol, "time": ts_str, "obv": obv, "delta": delta})
-    print(json_line, flush=True)
+    # Both lines go out in a single write and flush
+    sys.stdout.write(f"{line}\n{json_line}\n")
+    sys.stdout.flush()
 
 
 def compute_delta(current_close: float, prev_close: float, volume: float) -> float:
@@ -107,17 +113,20 @@ def main():
     symbol = symbol_pair
 
     try:
-        # Validate access by fetching two latest klines
-        klines = client.get_klines(symbol=symbol, interval=Client.KLINE_INTERVAL_1MINUTE, limit=2)
-        if not klines or len(klines) < 2:
+        # Validate access by fetching the three latest klines: the still-forming candle,
+        # the last closed candle and the one before it (for its previous close)
+        klines = client.get_klines(symbol=symbol, interval=Client.KLINE_INTERVAL_1MINUTE, limit=3)
+        if not klines or len(klines) < 3:
             print("ERROR: Not enough candle data available from Binance for symbol: {}".format(symbol), file=sys.stderr)
             sys.exit(2)
 
-        curr_k = kline_to_record(klines[-1])
-        prev_k = kline_to_record(klines[-2])
+        # Sync from the last closed candle only; the forming candle (klines[-1]) is left
+        # to the stream, which delivers it once with its final close and volume
+        curr_k = kline_to_record(klines[-2])
+        prev_k = kline_to_record(klines[-3])
 
         if obv_state is None:
-            # First run: initialize using previous close and current candle; OBV_prev starts at 0
+            # First run: initialize using previous close and the last closed candle; OBV_prev starts at 0
             prev_close = prev_k["close"]
             delta = compute_delta(curr_k["close"], prev_close, curr_k["volume"])
             obv_curr = obv_prev + delta
@@ -142,15 +151,9 @@ def main():
             prev_close = obv_state["prev_close"]
             last_open_time = int(obv_state["last_open_time"])
 
-            # Determine if there is already a new candle ready to process (first check)
-            # We'll fetch the latest candle to see if it's newer than last_open_time
-            latest_klines = client.get_klines(symbol=symbol, interval=Client.KLINE_INTERVAL_1MINUTE, limit=2)
-            if not latest_klines or len(latest_klines) < 2:
-                print("ERROR: Unable to fetch latest candle data for symbol: {}".format(symbol), file=sys.stderr)
-                sys.exit(4)
-
-            latest_k = kline_to_record(latest_klines[-1])
-            prev_seen_k = kline_to_record(latest_klines[-2])
+            # Determine if a closed candle newer than last_open_time is already available;
+            # the one-minute gap check below rejects states older than that candle
+            latest_k = curr_k
 
             # If there is a new candle since last processed
             new_open_time = int(latest_k["open_time"])
@@ -173,49 +176,78 @@ def main():
                 }
                 save_state(state_path, obv_state)
 
-        # Enter continuous monitoring loop
-        while True:
+        # Follow closed candles on the kline WebSocket instead of polling the REST API
+        stop = threading.Event()
+        exit_code = 0
+
+        def apply_candle(open_time, close, volume):
+            nonlocal obv_state
+            delta = compute_delta(close, obv_state["prev_close"], volume)
+            obv_curr = obv_state["obv"] + delta
+
+            print_line(symbol.replace("USDT", ""), open_time, obv_curr, delta)
+
+            obv_state = {
+                "obv": obv_curr,
+                "prev_close": close,
+                "last_open_time": open_time
+            }
+            save_state(state_path, obv_state)
+
+        def on_kline(msg):
+            nonlocal exit_code
+            if msg.get("e") == "error":
+                # Includes python-binance's terminal "max reconnect retries reached" event:
+                # the socket is gone, so stop instead of waiting on it forever
+                print(f"ERROR: WebSocket error: {msg.get('m')}", file=sys.stderr)
+                exit_code = 6
+                stop.set()
+                return
+            k = msg.get("k")
+            if not k or not k.get("x"):
+                return  # candle still open
+
             try:
-                klines = client.get_klines(symbol=symbol, interval=Client.KLINE_INTERVAL_1MINUTE, limit=2)
-                if not klines or len(klines) < 2:
-                    raise BinanceAPIException("Not enough candle data returned by Binance for symbol {}".format(symbol))
-
-                latest_k = kline_to_record(klines[-1])
-                prev_k = kline_to_record(klines[-2])
-
-                new_open_time = int(latest_k["open_time"])
-                if new_open_time > obv_state["last_open_time"]:
-                    if new_open_time - obv_state["last_open_time"] != 60_000:
-                        print("ERROR: Data gap detected (>1 minute) for symbol {}. last_open_time={}, new_open_time={}".format(
-                            symbol, obv_state["last_open_time"], new_open_time), file=sys.stderr)
-                        sys.exit(5)
-
-                    delta = compute_delta(latest_k["close"], obv_state["prev_close"], latest_k["volume"])
-                    obv_curr = obv_state["obv"] + delta
-
-                    print_line(symbol.replace("USDT", ""), new_open_time, obv_curr, delta)
-
-                    obv_state = {
-                        "obv": obv_curr,
-                        "prev_close": latest_k["close"],
-                        "last_open_time": new_open_time
-                    }
-                    save_state(state_path, obv_state)
-
-                # Sleep briefly before re-checking for the next minute
-                time.sleep(5)
-            except BinanceRequestException as e:
-                print(f"ERROR: Binance request exception: {e}", file=sys.stderr)
-                time.sleep(5)
-            except BinanceAPIException as e:
-                print(f"ERROR: Binance API exception: {e}", file=sys.stderr)
-                time.sleep(5)
-            except KeyboardInterrupt:
-                print("Interrupted by user. Exiting gracefully.")
-                sys.exit(0)
+                new_open_time = int(k["t"])
+                if new_open_time <= obv_state["last_open_time"]:
+                    return
+                if new_open_time - obv_state["last_open_time"] != 60_000:
+                    # A candle closed between the REST sync and the subscription (or the stream
+                    # dropped one): fetch the missed closed candles over REST, oldest first
+                    missed = client.get_klines(
+                        symbol=symbol,
+                        interval=Client.KLINE_INTERVAL_1MINUTE,
+                        startTime=obv_state["last_open_time"] + 60_000,
+                        endTime=new_open_time - 1,
+                    )
+                    for kline in missed:
+                        rec = kline_to_record(kline)
+                        if rec["open_time"] != obv_state["last_open_time"] + 60_000:
+                            break
+                        apply_candle(rec["open_time"], rec["close"], rec["volume"])
+
+                if new_open_time - obv_state["last_open_time"] != 60_000:
+                    print("ERROR: Data gap detected (>1 minute) for symbol {}. last_open_time={}, new_open_time={}".format(
+                        symbol, obv_state["last_open_time"], new_open_time), file=sys.stderr)
+                    exit_code = 5
+                    stop.set()
+                    return
+
+                apply_candle(new_open_time, float(k["c"]), float(k["v"]))
             except Exception as e:
                 print(f"ERROR: Unexpected exception: {e}", file=sys.stderr)
-                time.sleep(5)
+
+        twm = ThreadedWebsocketManager()
+        twm.start()
+        try:
+            twm.start_kline_socket(callback=on_kline, symbol=symbol, interval=Client.KLINE_INTERVAL_1MINUTE)
+            while not stop.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            print("Interrupted by user. Exiting gracefully.")
+        finally:
+            twm.stop()
+        sys.exit(exit_code)
     except BinanceAPIException as e:
         print(f"ERROR: Binance API exception during initialization: {e}", file=sys.stderr)
         sys.exit(2)
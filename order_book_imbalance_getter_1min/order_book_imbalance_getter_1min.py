@@ -8,10 +8,56 @@ import json
 import time
 import sys
 import logging
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
+# Binance allows 6000 request weight per minute per IP; stay under it with some headroom
+WEIGHT_PER_MINUTE = 5000
+
+_client = None
+
+def get_client() -> Client:
+    """Return a process-wide Binance client so repeated calls reuse one HTTP session."""
+    global _client
+    if _client is None:
+        _client = Client("", "")
+    return _client
+
+class TokenBucket:
+    """Thread-safe token bucket; take(n) blocks until n tokens are available."""
+
+    def __init__(self, rate_per_sec, capacity):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self, n=1):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve the tokens up front so concurrent callers queue behind each other
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+def depth_weight(limit):
+    """Binance request weight of one fetch_depth() call for the given level count."""
+    if limit <= 1:
+        return 2  # bookTicker, single symbol
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 25
+    if limit <= 1000:
+        return 50
+    return 250
+
 def build_pair(symbol_input):
     s = symbol_input.strip().upper()
     if s.endswith("USDT"):
@@ -19,8 +65,33 @@ def build_pair(symbol_input):
     return s + "USDT"
 
 def fetch_depth(client, pair, limit):
+    if limit <= 1:
+        # Top of book only: the bookTicker endpoint is lighter and has a lower request weight
+        ticker = client.get_orderbook_ticker(symbol=pair)
+        return {
+            'bids': [[ticker['bidPrice'], ticker['bidQty']]],
+            'asks': [[ticker['askPrice'], ticker['askQty']]],
+        }
     return client.get_order_book(symbol=pair, limit=limit)
 
+def sum_notional(entries, side, log=None):
+    """Sum price * qty over [price, qty] levels, skipping malformed entries."""
+    try:
+        return sum((float(price_str) * float(qty_str) for price_str, qty_str in entries), 0.0)
+    except (TypeError, ValueError):
+        pass
+
+    # Slow path: at least one level is malformed, so convert entry by entry
+    notional = 0.0
+    for price_str, qty_str in entries:
+        try:
+            notional += float(price_str) * float(qty_str)
+        except Exception:
+            if log:
+                log.warning(f"Invalid {side} entry: price={price_str}, qty={qty_str}")
+            continue
+    return notional
+
 def compute_obi_from_depth(depth, levels, log=None):
     bids = depth.get('bids', [])
     asks = depth.get('asks', [])
@@ -32,28 +103,8 @@ def compute_obi_from_depth(depth, levels, log=None):
     top_bids = bids[:levels]
     top_asks = asks[:levels]
 
-    notional_bid = 0.0
-    notional_ask = 0.0
-
-    for price_str, qty_str in top_bids:
-        try:
-            price = float(price_str)
-            qty = float(qty_str)
-            notional_bid += price * qty
-        except Exception:
-            if log:
-                log.warning(f"Invalid bid entry: price={price_str}, qty={qty_str}")
-            continue
-
-    for price_str, qty_str in top_asks:
-        try:
-            price = float(price_str)
-            qty = float(qty_str)
-            notional_ask += price * qty
-        except Exception:
-            if log:
-                log.warning(f"Invalid ask entry: price={price_str}, qty={qty_str}")
-            continue
+    notional_bid = sum_notional(top_bids, "bid", log)
+    notional_ask = sum_notional(top_asks, "ask", log)
 
     denom = notional_bid + notional_ask
     if denom <= 0.0:
@@ -61,9 +112,34 @@ def compute_obi_from_depth(depth, levels, log=None):
     obi = (notional_bid - notional_ask) / denom
     return obi, notional_bid, notional_ask
 
+def sample_obi(client, pair, levels, max_retries, log, bucket=None):
+    """Fetch depth for pair with retries and return (obi, notional_bid, notional_ask)."""
+    attempt = 0
+    while attempt < max_retries:
+        if bucket is not None:
+            bucket.take(depth_weight(levels))
+        try:
+            depth_data = fetch_depth(client, pair, levels)
+            break
+        except (BinanceAPIException, BinanceRequestException) as e:
+            attempt += 1
+            wait = 2 ** attempt
+            log.warning(f"Depth fetch for {pair} failed (attempt {attempt}/{max_retries}): {e}. Retrying in {wait}s...")
+            time.sleep(wait)
+        except Exception as e:
+            attempt += 1
+            wait = 2 ** attempt
+            log.warning(f"Unexpected error fetching depth for {pair}: {e}. Retrying in {wait}s...")
+            time.sleep(wait)
+    else:
+        log.warning(f"Depth data for {pair} unavailable after retries. Emitting 0.0 OBI for this interval.")
+        return 0.0, 0.0, 0.0
+
+    return compute_obi_from_depth(depth_data, levels, log=log)
+
 def main():
     parser = argparse.ArgumentParser(description="Calculate order book imbalance (OBI) from Binance depth data on a 1-minute cadence.")
-    parser.add_argument('--symbol', required=True, help='Trading symbol base asset (e.g., BTC). The script will use USDT pairing (BTCUSDT) by default.')
+    parser.add_argument('--symbol', required=True, help='Trading symbol base asset (e.g., BTC), or a comma-separated list (e.g., BTC,ETH). The script will use USDT pairing (BTCUSDT) by default.')
     parser.add_argument('--levels', type=int, default=5, help='Number of levels to consider from the order book (default: 5)')
     parser.add_argument('--interval_seconds', type=int, default=60, help='Interval between samples in seconds (default: 60)')
     args = parser.parse_args()
@@ -78,59 +154,59 @@ def main():
         handler.setFormatter(formatter)
         logger.addHandler(handler)
 
-    pair = build_pair(args.symbol)
+    pairs = []
+    for sym in args.symbol.split(','):
+        if sym.strip() and build_pair(sym) not in pairs:
+            pairs.append(build_pair(sym))
+    if not pairs:
+        parser.error("--symbol must name at least one asset")
     levels = max(1, int(args.levels))
     interval = max(1, int(args.interval_seconds))
 
-    client = Client("", "")
+    client = get_client()
 
     max_retries = 3
 
+    # Compact JSON record emitted every interval; the constant parts are encoded once per pair.
+    # Floats use repr(), which is exactly what json.dumps emits for finite values.
+    line_fmts = [
+        '{"timestamp":"%s","symbol":'
+        + json.dumps(pair, ensure_ascii=False).replace('%', '%%')
+        + ',"obi":%r,"notional_bid":%r,"notional_ask":%r,"levels":'
+        + str(levels)
+        + '}\n'
+        for pair in pairs
+    ]
+
+    # Pace requests client-side so bursts of symbols or retries never trip HTTP 429/418
+    bucket = TokenBucket(WEIGHT_PER_MINUTE / 60.0, WEIGHT_PER_MINUTE)
+
+    def sample(pair):
+        return sample_obi(client, pair, levels, max_retries, logger, bucket)
+
+    # Multiple symbols are sampled concurrently so one tick costs a single round trip.
+    # Worker threads start lazily, so a single symbol never spawns one.
+    workers = min(len(pairs), 8)
+
     try:
-        while True:
-            depth_data = None
-            obi = 0.0
-            notional_bid = 0.0
-            notional_ask = 0.0
-
-            attempt = 0
-            while attempt < max_retries:
-                try:
-                    depth_data = fetch_depth(client, pair, levels)
-                    break
-                except (BinanceAPIException, BinanceRequestException) as e:
-                    attempt += 1
-                    wait = 2 ** attempt
-                    logger.warning(f"Depth fetch failed (attempt {attempt}/{max_retries}): {e}. Retrying in {wait}s...")
-                    time.sleep(wait)
-                except Exception as e:
-                    attempt += 1
-                    wait = 2 ** attempt
-                    logger.warning(f"Unexpected error fetching depth: {e}. Retrying in {wait}s...")
-                    time.sleep(wait)
-
-            if depth_data is None:
-                obi = 0.0
-                notional_bid = 0.0
-                notional_ask = 0.0
-                logger.warning("Depth data unavailable after retries. Emitting 0.0 OBI for this interval.")
-            else:
-                obi, notional_bid, notional_ask = compute_obi_from_depth(depth_data, levels, log=logger)
-
-            ts = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-            output = {
-                "timestamp": ts,
-                "symbol": pair,
-                "obi": round(float(obi), 6),
-                "notional_bid": round(float(notional_bid), 6),
-                "notional_ask": round(float(notional_ask), 6),
-                "levels": levels
-            }
-
-            print(json.dumps(output, separators=(',', ':'), ensure_ascii=False))
-            sys.stdout.flush()
-
-            time.sleep(interval)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while True:
+                if workers == 1:
+                    results = [sample(pairs[0])]
+                else:
+                    results = list(pool.map(sample, pairs))
+
+                ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                for line_fmt, (obi, notional_bid, notional_ask) in zip(line_fmts, results):
+                    sys.stdout.write(line_fmt % (
+                        ts,
+                        round(float(obi), 6),
+                        round(float(notional_bid), 6),
+                        round(float(notional_ask), 6),
+                    ))
+                sys.stdout.flush()
+
+                time.sleep(interval)
 
     except KeyboardInterrupt:
         sys.stderr.write("\nInterrupted by user. Exiting.\n")
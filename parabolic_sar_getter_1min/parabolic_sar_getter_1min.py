@@ -2,9 +2,14 @@
 """
 Gets current Parabolic SAR for any symbol on 1min timeframe
 Usage: python parabolic_sar_getter_1min.py --symbol BTCUSDT --limit 500
+Notes:
+  - The SAR state after the last closed candle is persisted to psar_<symbol>_<limit>_state.json, so
+    a run one minute later only fetches and steps through the one candle closed since then
+    (use --no-state to disable)
 """
 import argparse
 import json
+import os
 import sys
 from datetime import datetime
 
@@ -12,78 +17,117 @@ from binance.client import Client
 from binance.exceptions import BinanceAPIException
 
 
-def compute_parabolic_sar(highs, lows, closes, af_start=0.02, af_increment=0.02, af_max=0.20):
+STATE_DIR = "."  # store state in current directory; can be changed if needed
+CANDLE_MS = 60_000
+
+
+def psar_initial_state(highs, lows, closes, af_start=0.02):
     """
-    Compute Parabolic SAR for a series of candles.
-    highs, lows, closes: lists of floats of equal length
-    Returns (sar_value, trend) for the last candle
+    Seed the Parabolic SAR from the first two candles.
+    Returns the state tuple (sar, ep, af, up) where up is True for an uptrend.
     """
-    n = len(highs)
-    if n < 2:
-        return None, None
-
-    # Initialize trend, SAR, EP depending on first movement
-    if closes[1] > closes[0]:
+    # Initialize trend, SAR, EP depending on first movement.
+    # The trend is tracked as a bool (True = up) to keep the per-candle test cheap.
+    up = closes[1] > closes[0]
+    if up:
         sar = min(lows[0], lows[1])
-        trend = "up"
         ep = max(highs[0], highs[1])
     else:
         sar = max(highs[0], highs[1])
-        trend = "down"
         ep = min(lows[0], lows[1])
+    return sar, ep, af_start, up
 
-    af = af_start
 
-    for i in range(2, n):
-        if trend == "up":
-            sar_next = sar + af * (ep - sar)
+def advance_parabolic_sar(state, highs, lows, af_start=0.02, af_increment=0.02, af_max=0.20):
+    """
+    Step a (sar, ep, af, up) state forward over the given candles.
+    Returns the state after the last candle (the input state if there are none).
+    """
+    sar, ep, af, up = state
+
+    for high, low in zip(highs, lows):
+        # SAR advance is identical for both trends; only the reversal test differs
+        sar_next = sar + af * (ep - sar)
+        if up:
             # If SAR crosses above the current low, switch to down
-            if sar_next > lows[i]:
-                sar = lows[i]
-                trend = "down"
-                ep = lows[i]
+            if sar_next > low:
+                sar = ep = low
+                up = False
                 af = af_start
-            else:
-                sar = sar_next
-                # Update EP if new high
-                if highs[i] > ep:
-                    ep = highs[i]
-                    af = min(af + af_increment, af_max)
-        else:  # trend == "down"
-            sar_next = sar + af * (ep - sar)
+                continue
+            sar = sar_next
+            # Update EP if new high
+            if high > ep:
+                ep = high
+                af = af + af_increment if af + af_increment < af_max else af_max
+        else:
             # If SAR crosses below the current high, switch to up
-            if sar_next < highs[i]:
-                sar = highs[i]
-                trend = "up"
-                ep = highs[i]
+            if sar_next < high:
+                sar = ep = high
+                up = True
                 af = af_start
-            else:
-                sar = sar_next
-                # Update EP if new low
-                if lows[i] < ep:
-                    ep = lows[i]
-                    af = min(af + af_increment, af_max)
+                continue
+            sar = sar_next
+            # Update EP if new low
+            if low < ep:
+                ep = low
+                af = af + af_increment if af + af_increment < af_max else af_max
 
-    return sar, trend
+    return sar, ep, af, up
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Parabolic SAR getter for 1-minute candles using Binance API.")
-    parser.add_argument('--symbol', required=True, help='Trading symbol (e.g., BTCUSDT)')
-    parser.add_argument('--limit', type=int, default=500, help='Number of candles to fetch (default 500)')
-    args = parser.parse_args()
+def compute_parabolic_sar(highs, lows, closes, af_start=0.02, af_increment=0.02, af_max=0.20):
+    """
+    Compute Parabolic SAR for a series of candles.
+    highs, lows, closes: lists of floats of equal length
+    Returns (sar_value, trend) for the last candle
+    """
+    n = len(highs)
+    if n < 2:
+        return None, None
 
-    symbol = (args.symbol or "").strip().upper()
-    if not symbol:
-        print("ERROR: Invalid symbol")
-        sys.exit(2)
+    state = psar_initial_state(highs, lows, closes, af_start)
+    sar, _, _, up = advance_parabolic_sar(state, highs[2:], lows[2:], af_start, af_increment, af_max)
+    return sar, "up" if up else "down"
 
-    limit = args.limit if args.limit and args.limit > 1 else 500
-    # Binance get_klines requires a valid symbol; use free API with no authentication
-    client = Client("", "")
 
+def load_state(state_path: str):
+    """Return the saved (sar, ep, af, up) state and its last closed open time, or None."""
+    if not os.path.exists(state_path):
+        return None
     try:
-        klines = client.get_klines(symbol=symbol, interval=Client.KLINE_INTERVAL_1MINUTE, limit=limit)
+        with open(state_path, "r") as f:
+            saved = json.load(f)
+        state = (float(saved["sar"]), float(saved["ep"]), float(saved["af"]), saved["trend"] == "up")
+        return state, int(saved["last_open_time"])
+    except Exception as e:
+        print(f"WARNING: Ignoring unreadable state file {state_path}: {e}", file=sys.stderr)
+        return None
+
+
+def save_state(state_path: str, state, last_open_time: int) -> None:
+    sar, ep, af, up = state
+    tmp_path = state_path + ".tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps({
+                "sar": sar,
+                "ep": ep,
+                "af": af,
+                "trend": "up" if up else "down",
+                "last_open_time": last_open_time,
+            }, separators=(",", ":")))
+        os.replace(tmp_path, state_path)
+    except Exception as e:
+        print(f"WARNING: Failed to save state to {state_path}: {e}", file=sys.stderr)
+
+
+def fetch_klines(client, symbol, limit, start_time=None):
+    params = {"symbol": symbol, "interval": Client.KLINE_INTERVAL_1MINUTE, "limit": limit}
+    if start_time is not None:
+        params["startTime"] = start_time
+    try:
+        return client.get_klines(**params)
     except BinanceAPIException as e:
         # Provide more specific error messages if possible
         msg = str(e)
@@ -96,21 +140,73 @@ def main():
         print("ERROR: Data fetch failed")
         sys.exit(2)
 
-    if not klines or len(klines) < 2:
-        print("ERROR: Insufficient data")
+
+def main():
+    parser = argparse.ArgumentParser(description="Parabolic SAR getter for 1-minute candles using Binance API.")
+    parser.add_argument('--symbol', required=True, help='Trading symbol (e.g., BTCUSDT)')
+    parser.add_argument('--limit', type=int, default=500, help='Number of candles to fetch (default 500)')
+    parser.add_argument('--no-state', action='store_true', help='Do not read or write the persisted SAR state; always recompute from --limit candles')
+    args = parser.parse_args()
+
+    symbol = (args.symbol or "").strip().upper()
+    if not symbol:
+        print("ERROR: Invalid symbol")
         sys.exit(2)
 
-    highs = [float(k[2]) for k in klines]
-    lows = [float(k[3]) for k in klines]
-    closes = [float(k[4]) for k in klines]
-    times = [int(k[6]) for k in klines]  # close times in ms
+    limit = args.limit if args.limit and args.limit > 1 else 500
+    # Binance get_klines requires a valid symbol; use free API with no authentication
+    client = Client("", "")
+
+    # Keyed by --limit too, so a state seeded from a different window length is never reused
+    state_path = os.path.join(STATE_DIR, f"psar_{symbol}_{limit}_state.json")
+    saved = None if args.no_state else load_state(state_path)
+
+    klines = None
+    if saved is not None:
+        # Only fetch candles after the last closed candle already folded into the saved state
+        next_open_time = saved[1] + CANDLE_MS
+        klines = fetch_klines(client, symbol, 3, start_time=next_open_time)
+        # The state is only stepped forward over at most one newly closed candle (plus the one
+        # still forming); a gap or a longer pause falls back to a full recompute over --limit
+        # candles, so the output never depends on how far back an old state was seeded
+        if not klines or int(klines[0][0]) != next_open_time or len(klines) > 2:
+            klines = None
+            saved = None
+
+    if klines is None:
+        klines = fetch_klines(client, symbol, limit)
+        if not klines or len(klines) < 2:
+            print("ERROR: Insufficient data")
+            sys.exit(2)
+
+    # Transpose the kline rows into columns once, then convert only the columns needed
+    columns = list(zip(*klines))
+    highs = list(map(float, columns[2]))
+    lows = list(map(float, columns[3]))
+    closes = list(map(float, columns[4]))
+
+    # The last kline is the candle still forming: it is applied to the output but never
+    # persisted, so the saved state only ever covers closed candles.
+    if saved is not None:
+        closed_state = advance_parabolic_sar(saved[0], highs[:-1], lows[:-1])
+    elif len(klines) >= 3:
+        closed_state = advance_parabolic_sar(psar_initial_state(highs, lows, closes), highs[2:-1], lows[2:-1])
+    else:
+        closed_state = None
+
+    if closed_state is not None:
+        sar_value, _, _, up = advance_parabolic_sar(closed_state, highs[-1:], lows[-1:])
+        trend = "up" if up else "down"
+        if not args.no_state:
+            save_state(state_path, closed_state, int(klines[-2][0]) if len(klines) >= 2 else saved[1])
+    else:
+        sar_value, trend = compute_parabolic_sar(highs, lows, closes)
 
-    sar_value, trend = compute_parabolic_sar(highs, lows, closes)
     if sar_value is None or trend not in ("up", "down"):
         print("ERROR: Insufficient data")
         sys.exit(2)
 
-    last_ts_ms = times[-1]
+    last_ts_ms = int(klines[-1][6])  # close time in ms
     dt = datetime.utcfromtimestamp(last_ts_ms / 1000.0)
     timestamp_iso = dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
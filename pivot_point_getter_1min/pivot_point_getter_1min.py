@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 """
-Calculates standard intraday pivot points (PP, S1, S2, R1, R2) from 1-minute Binance price data for a given symbol.
+Calculates standard intraday pivot points (PP, S1, S2, R1, R2) from Binance price data for a given symbol.
 Usage: python pivot_point_getter_1min.py --symbol BTCUSDT
 
 Notes:
-- Data retrieval uses UTC. The script fetches the previous calendar day in UTC and computes OHLC
-  (PrevHigh, PrevLow, PrevClose) from that day to calculate standard intraday pivot points.
+- Data retrieval uses UTC. The script fetches the previous calendar day's daily candle in UTC and
+  uses its OHLC (PrevHigh, PrevLow, PrevClose) to calculate standard intraday pivot points.
+- The previous day's OHLC is cached in pivot_<PAIR>_cache.json and reused until the UTC day rolls over.
 - Symbol handling is flexible: if you pass BTC, it will assume BTCUSDT as the pair.
 - Requires python-binance (Banking free API, no authentication).
 
@@ -13,11 +14,15 @@ Example:
 python pivot_point_getter_1min.py --symbol BTC
 """
 import argparse
+import json
+import os
 import sys
 import datetime
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 
+CACHE_DIR = "."  # previous-day OHLC cache location; can be changed if needed
+
 def normalize_symbol(symbol_input: str) -> str:
     """
     Normalize the symbol input to a valid Binance trading pair.
@@ -28,8 +33,34 @@ def normalize_symbol(symbol_input: str) -> str:
         s = s + "USDT"
     return s
 
+def load_cached_ohlc(cache_path: str, date_str: str):
+    """
+    Return (high, low, close) for date_str from the cache file, or None on a miss.
+    A completed UTC day never changes, so a cached entry never needs refreshing.
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+        if cached.get("date") != date_str:
+            return None
+        return float(cached["high"]), float(cached["low"]), float(cached["close"])
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable cache {cache_path}: {e}", file=sys.stderr)
+        return None
+
+def save_cached_ohlc(cache_path: str, date_str: str, high: float, low: float, close: float) -> None:
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps({"date": date_str, "high": high, "low": low, "close": close}, separators=(",", ":")))
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: Failed to write cache {cache_path}: {e}", file=sys.stderr)
+
 def main():
-    parser = argparse.ArgumentParser(description="Compute standard intraday pivot points from 1-minute Binance data for a given symbol (UTC).")
+    parser = argparse.ArgumentParser(description="Compute standard intraday pivot points from the previous UTC day's Binance data for a given symbol.")
     parser.add_argument('--symbol', required=True, help='Trading symbol (e.g., BTCUSDT or BTC). The script will default to the USDT pair if missing.')
     args = parser.parse_args()
 
@@ -40,36 +71,43 @@ def main():
     now_utc = datetime.datetime.utcnow()
     prev_date = (now_utc).date() - datetime.timedelta(days=1)
     start_prev = datetime.datetime(prev_date.year, prev_date.month, prev_date.day, 0, 0, 0, tzinfo=datetime.timezone.utc)
-    end_prev = start_prev + datetime.timedelta(days=1)
+
+    # Previous-day OHLC is immutable once the UTC day has closed, so cache it per symbol
+    prev_date_str = prev_date.isoformat()
+    cache_path = os.path.join(CACHE_DIR, f"pivot_{symbol_pair}_cache.json")
 
     try:
-        client = Client("", "")
-
-        # Fetch 1-minute klines for the previous day only
-        klines = client.get_klines(
-            symbol=symbol_pair,
-            interval=Client.KLINE_INTERVAL_1MINUTE,
-            start_str=start_prev.strftime("%Y-%m-%d %H:%M:%S"),
-            end_str=end_prev.strftime("%Y-%m-%d %H:%M:%S")
-        )
-
-        if not isinstance(klines, list) or len(klines) == 0:
-            print(f"Error: No data returned for previous day for symbol {symbol_pair}.", file=sys.stderr)
-            sys.exit(1)
-
-        # Expect 1440 candles for a complete UTC day
-        EXPECTED_CANDLES = 24 * 60  # 1440
-        if len(klines) < EXPECTED_CANDLES:
-            print(f"Error: Incomplete data for previous day. Expected {EXPECTED_CANDLES} candles, got {len(klines)}.", file=sys.stderr)
-            sys.exit(1)
-
-        if len(klines) > EXPECTED_CANDLES:
-            klines = klines[:EXPECTED_CANDLES]
-
-        # OHLC for the previous day
-        prev_high = max(float(k[2]) for k in klines)
-        prev_low = min(float(k[3]) for k in klines)
-        prev_close = float(klines[-1][4])
+        cached = load_cached_ohlc(cache_path, prev_date_str)
+        if cached is not None:
+            prev_high, prev_low, prev_close = cached
+        else:
+            client = Client("", "")
+
+            # The previous day's daily kline carries its exact High/Low/Close, so one row
+            # replaces scanning 1440 one-minute candles
+            start_prev_ms = int(start_prev.timestamp() * 1000)
+            klines = client.get_klines(
+                symbol=symbol_pair,
+                interval=Client.KLINE_INTERVAL_1DAY,
+                startTime=start_prev_ms,
+                limit=1
+            )
+
+            if not isinstance(klines, list) or len(klines) == 0:
+                print(f"Error: No data returned for previous day for symbol {symbol_pair}.", file=sys.stderr)
+                sys.exit(1)
+
+            prev_kline = klines[0]
+            if int(prev_kline[0]) != start_prev_ms:
+                print(f"Error: Incomplete data for previous day. No daily candle opened at {start_prev.isoformat()}.", file=sys.stderr)
+                sys.exit(1)
+
+            # OHLC for the previous day
+            prev_high = float(prev_kline[2])
+            prev_low = float(prev_kline[3])
+            prev_close = float(prev_kline[4])
+
+            save_cached_ohlc(cache_path, prev_date_str, prev_high, prev_low, prev_close)
 
         # Pivot calculations
         pp = (prev_high + prev_low + prev_close) / 3.0
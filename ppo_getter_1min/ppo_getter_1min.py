@@ -15,7 +15,7 @@ Example:
 
 import argparse
 import sys
-from datetime import datetime
+import time
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
@@ -49,43 +49,42 @@ def compute_ema_series(prices, period: int):
     if len(prices) < period:
         return []
     alpha = 2.0 / (period + 1)
+    beta = 1.0 - alpha
     # Seed with SMA of first 'period' prices
-    first_sma = sum(prices[:period]) / period
-    emas = [first_sma]
-    for i in range(period, len(prices)):
-        ema_today = alpha * prices[i] + (1 - alpha) * emas[-1]
-        emas.append(ema_today)
+    ema = sum(prices[:period]) / period
+    emas = [ema]
+    append = emas.append
+    for price in prices[period:]:
+        ema = alpha * price + beta * ema
+        append(ema)
     return emas
 
 
 def compute_ppo_from_closes(closes, fast=12, slow=26):
     """
     Compute PPO values from a list of close prices.
-    Returns a list of tuples: (t_index, ppo_value)
-    - t_index corresponds to the index in 'closes' for which the PPO is computed
+    Returns two parallel lists: (t_indices, ppo_values)
+    - t_indices[i] is the index in 'closes' for which ppo_values[i] is computed
     """
     emas_fast = compute_ema_series(closes, fast)
     emas_slow = compute_ema_series(closes, slow)
 
     if not emas_fast or not emas_slow:
-        return []
+        return [], []
 
+    # emas_fast[i] belongs to bar i + fast - 1 and emas_slow[j] to bar j + slow - 1,
+    # so trimming the longer series' head lines both up bar for bar.
     start_t = max(fast - 1, slow - 1)
-    ppo = []
-    for t in range(start_t, len(closes)):
-        fast_idx = t - (fast - 1)
-        slow_idx = t - (slow - 1)
-        if fast_idx < 0 or slow_idx < 0:
-            continue
-        if fast_idx >= len(emas_fast) or slow_idx >= len(emas_slow):
-            continue
-        ema_f = emas_fast[fast_idx]
-        ema_s = emas_slow[slow_idx]
+    t_indices = []
+    ppo_values = []
+    for t, ema_f, ema_s in zip(range(start_t, len(closes)),
+                               emas_fast[max(slow - fast, 0):],
+                               emas_slow[max(fast - slow, 0):]):
         if ema_s == 0:
             continue
-        value = ((ema_f - ema_s) / ema_s) * 100.0
-        ppo.append((t, value))
-    return ppo
+        t_indices.append(t)
+        ppo_values.append(((ema_f - ema_s) / ema_s) * 100.0)
+    return t_indices, ppo_values
 
 
 def main():
@@ -110,15 +109,12 @@ def main():
         print(f"Error: Received invalid response for symbol {symbol_binance}.", file=sys.stderr)
         sys.exit(1)
 
-    closes = []
-    times = []
     try:
-        for k in klines:
-            # k: [OpenTime, Open, High, Low, Close, Volume, ...]
-            open_time = int(k[0])
-            close_price = float(k[4])
-            closes.append(close_price)
-            times.append(open_time)
+        # k: [OpenTime, Open, High, Low, Close, Volume, ...]
+        # Transpose once and convert only the two columns that are used
+        columns = list(zip(*klines))
+        times = list(map(int, columns[0]))
+        closes = list(map(float, columns[4]))
     except Exception as e:
         print(f"Error parsing klines data: {e}", file=sys.stderr)
         sys.exit(1)
@@ -128,28 +124,26 @@ def main():
         sys.exit(1)
 
     # Compute PPO
-    ppo_series = compute_ppo_from_closes(closes, fast=12, slow=26)
-    if not ppo_series:
+    ppo_indices, ppo_values = compute_ppo_from_closes(closes, fast=12, slow=26)
+    if not ppo_values:
         print("Error: Could not compute PPO due to insufficient data after EMA seeding.", file=sys.stderr)
         sys.exit(1)
 
     # Latest PPO value and timestamp
-    latest_idx, latest_ppo = ppo_series[-1]
-    latest_time_ms = times[latest_idx]
-    latest_timestamp = datetime.utcfromtimestamp(latest_time_ms / 1000.0).strftime('%Y-%m-%dT%H:%M:%SZ')
+    latest_ppo = ppo_values[-1]
+    latest_time_ms = times[ppo_indices[-1]]
+    latest_timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(latest_time_ms // 1000))
 
     print(f"Symbol: {symbol_binance} | PPO(12,26) = {latest_ppo:.4f}% | timestamp={latest_timestamp}")
 
     # Optional tail
-    tail_n = min(args.tail, len(ppo_series))
+    tail_n = min(args.tail, len(ppo_values))
     if tail_n > 0:
-        tail_entries = ppo_series[-tail_n:]
         tail_strs = []
-        for t_idx, val in tail_entries:
-            ts = datetime.utcfromtimestamp(times[t_idx] / 1000.0).strftime('%Y-%m-%dT%H:%M:%SZ')
+        for t_idx, val in zip(ppo_indices[-tail_n:], ppo_values[-tail_n:]):
+            ts = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(times[t_idx] // 1000))
             tail_strs.append(f"{ts}:{val:.4f}%")
         print("PPO tail (last {} points): {}".format(tail_n, " | ".join(tail_strs)))
 
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,11 +4,13 @@ Calculates Price Rate of Change (PROC) for a given symbol on 1-minute timeframe
 Usage: python proc_getter_1min.py --symbol BTC
 """
 import argparse
-import datetime
+import re
 import time
 import sys
 from binance.client import Client
 
+SYMBOL_RE = re.compile(r"[A-Z0-9]{1,20}")
+
 def normalize_symbol(symbol: str) -> str:
     s = symbol.strip().upper()
     if not s:
@@ -35,6 +37,8 @@ def main():
         sys.exit(2)
 
     symbol = normalize_symbol(args.symbol)
+    if not SYMBOL_RE.fullmatch(symbol):
+        parser.error(f"invalid symbol '{args.symbol}'")
     lookback = args.lookback
 
     # Initialize Binance client (no authentication for free endpoints)
@@ -80,9 +84,9 @@ def main():
     # Timestamp of the latest candle's close time (CloseTime)
     try:
         close_time_ms = int(klines[-1][6])
-        ts = datetime.datetime.utcfromtimestamp(close_time_ms / 1000.0).strftime('%Y-%m-%dT%H:%M:%SZ')
+        ts = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(close_time_ms // 1000))
     except (IndexError, ValueError) as e:
-        ts = datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+        ts = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
 
     print("PROC_1m({}) = {:.2f}% as of {}".format(symbol, proc, ts))
 
@@ -11,12 +11,22 @@ Notes:
 import argparse
 import json
 import sys
-from datetime import datetime
+import time
 import math
+from itertools import accumulate
 
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
 def normalize_pair(symbol: str) -> str:
     s = symbol.strip().upper()
     if s.endswith("USDT"):
@@ -28,9 +38,11 @@ def fetch_klines(client: Client, pair: str, limit: int = 200):
         klines = client.get_klines(symbol=pair, interval=Client.KLINE_INTERVAL_1MINUTE, limit=limit)
         if not klines or len(klines) < 2:
             raise ValueError("Insufficient data: need at least 2 bars.")
-        times = [int(k[0]) for k in klines]
-        closes = [float(k[4]) for k in klines]
-        volumes = [float(k[5]) for k in klines]
+        # Transpose the kline rows into columns once, then convert only the columns needed
+        columns = list(zip(*klines))
+        times = list(map(int, columns[0]))
+        closes = list(map(float, columns[4]))
+        volumes = list(map(float, columns[5]))
         return times, closes, volumes
     except BinanceAPIException as e:
         raise RuntimeError(f"Binance API error: {e}") from e
@@ -43,16 +55,12 @@ def compute_pvt(times, closes, volumes):
     n = len(closes)
     if n < 2:
         raise ValueError("Need at least 2 bars to compute PVT.")
-    pvt = [0.0] * n
-    for i in range(1, n):
-        delta = closes[i] - closes[i - 1]
-        prev_close = closes[i - 1]
-        if prev_close != 0.0:
-            pct_change = delta / prev_close
-        else:
-            pct_change = 0.0  # avoid division by zero
-        pvt[i] = pvt[i - 1] + volumes[i] * pct_change
-    return pvt
+    # PVT is a prefix sum of volume-weighted percentage changes
+    increments = (
+        vol * ((close - prev_close) / prev_close) if prev_close != 0.0 else 0.0  # avoid division by zero
+        for prev_close, close, vol in zip(closes, closes[1:], volumes[1:])
+    )
+    return list(accumulate(increments, initial=0.0))
 
 def main():
     parser = argparse.ArgumentParser(description="Calculate Price-Volume Trend (PVT) for a symbol on 1m timeframe.")
@@ -80,23 +88,25 @@ def main():
         print(f"Error computing PVT: {e}", file=sys.stderr)
         sys.exit(3)
 
-    # Validate data for NaN/Inf
-    if not all(isinstance(v, (int, float)) and math.isfinite(v) for v in pvt):
+    # Validate data for NaN/Inf. PVT is a running float sum and a NaN/Inf term
+    # poisons every later sum, so checking the final value covers the whole series.
+    if not math.isfinite(pvt[-1]):
         print("Data contains non-finite values in PVT computation.", file=sys.stderr)
         sys.exit(4)
 
-    pvt_series = [{"t": int(ts), "pvt": float(p)} for ts, p in zip(times, pvt)]
+    # times are already ints and pvt already floats, so no per-point conversion is needed
+    pvt_series = [{"t": ts, "pvt": p} for ts, p in zip(times, pvt)]
     output = {"symbol": pair, "interval": "1m", "pvt": pvt_series}
 
     try:
-        print(json.dumps(output))
+        print(_dumps(output))
     except Exception as e:
         print(f"Error producing JSON output: {e}", file=sys.stderr)
         sys.exit(5)
 
     latest_ts = times[-1]
     latest_pvt = pvt[-1]
-    ts_iso = datetime.utcfromtimestamp(latest_ts / 1000.0).strftime('%Y-%m-%d %H:%M:%S')
+    ts_iso = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(latest_ts // 1000))
     print(f"Latest PVT for {pair} at {ts_iso}: {latest_pvt}")
 
 if __name__ == "__main__":
@@ -6,10 +6,17 @@ Mapping: BTC -> BTCUSDT by default
 """
 import argparse
 import json
+import re
 import sys
-from datetime import datetime, timezone
+import time
+from collections import deque
+from operator import itemgetter
 from binance.client import Client
 
+SYMBOL_RE = re.compile(r"[A-Z0-9]{1,20}")
+
+_get_hlc = itemgetter(2, 3, 4)  # high, low, close fields of a kline row
+
 def normalize_symbol(symbol: str) -> str:
     s = symbol.strip().upper()
     if len(s) <= 4:
@@ -27,6 +34,9 @@ def main():
     N = max(1, int(args.n))
     symbol_input = args.symbol
 
+    if not SYMBOL_RE.fullmatch(symbol_input.strip().upper()):
+        parser.error(f"invalid symbol '{symbol_input}'")
+
     symbol_code = normalize_symbol(symbol_input)
     # Binance free API client (no authentication)
     client = Client("", "")
@@ -45,28 +55,33 @@ def main():
         print(f"Insufficient data: need at least {N} 1-minute bars for symbol {symbol_code}, got {len(klines)}", file=sys.stderr)
         sys.exit(3)
 
-    tps = []
-    times = []
+    # Single pass: typical prices feed a running sum over the last N bars,
+    # so the SMA is ready as soon as the final candle is parsed.
+    window = deque(maxlen=N)
+    running = 0.0
+    tp = 0.0
     for k in klines:
         try:
-            high = float(k[2])
-            low = float(k[3])
-            close = float(k[4])
+            high, low, close = _get_hlc(k)
+            high = float(high)
+            low = float(low)
+            close = float(close)
         except Exception:
             print("Error parsing OHLC data from klines response.", file=sys.stderr)
             sys.exit(4)
         tp = (high + low + close) / 3.0
-        tps.append(tp)
-        times.append(int(k[0]))  # open time in ms
+        if len(window) == N:
+            running -= window[0]
+        window.append(tp)
+        running += tp
 
     # Use the last N TPs for SMA
-    if len(tps) < N:
+    if len(window) < N:
         print(f"Insufficient data: computed TPs fewer than N={N}", file=sys.stderr)
         sys.exit(5)
 
-    tp_last = tps[-1]
-    sma_window = tps[-N:]
-    sma_last = sum(sma_window) / N if N > 0 else 0.0
+    tp_last = tp
+    sma_last = running / N
 
     if sma_last == 0:
         print("Division by zero avoided: SMA_TP_last is zero.", file=sys.stderr)
@@ -75,9 +90,8 @@ def main():
     qstick = ((tp_last - sma_last) / sma_last) * 100.0
 
     # Time to output
-    latest_open_ms = times[-1]
-    dt = datetime.fromtimestamp(latest_open_ms / 1000.0, tz=timezone.utc)
-    timestr = dt.isoformat().replace("+00:00", "Z")
+    latest_open_ms = int(klines[-1][0])
+    timestr = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(latest_open_ms // 1000))
 
     output = {
         "symbol": symbol_code,
@@ -11,8 +11,8 @@ Notes:
 """
 
 import argparse
-import datetime
 import sys
+import time
 from binance.client import Client
 
 
@@ -20,6 +20,23 @@ ROC_PERIOD_DEFAULT = 10
 CLI_INTERVAL = '1m'
 
 
+_listed_symbols = None
+
+
+def get_listed_symbols(client: Client):
+    """
+    Return the set of symbols listed on Binance, fetched once per process from exchangeInfo.
+    Returns None if exchangeInfo is unavailable, in which case callers probe symbols directly.
+    """
+    global _listed_symbols
+    if _listed_symbols is None:
+        try:
+            _listed_symbols = {s["symbol"] for s in client.get_exchange_info()["symbols"]}
+        except Exception:
+            return None
+    return _listed_symbols
+
+
 def get_roc_for_symbol(client: Client, input_symbol: str, roc_period: int):
     """
     Attempts to fetch ROC data for the given symbol and ROC period.
@@ -46,6 +63,14 @@ def get_roc_for_symbol(client: Client, input_symbol: str, roc_period: int):
             seen.add(c)
             candidates_unique.append(c)
 
+    # Resolve the variant against the exchange's symbol list up front, so only
+    # one klines request is issued instead of probing each variant in turn
+    listed = get_listed_symbols(client)
+    if listed is not None:
+        candidates_unique = [c for c in candidates_unique if c in listed]
+        if not candidates_unique:
+            raise ValueError(f"No Binance symbol found for '{base}' (tried {', '.join(candidates)}).")
+
     last_error = None
 
     limit = roc_period + 1
@@ -84,10 +109,9 @@ def get_roc_for_symbol(client: Client, input_symbol: str, roc_period: int):
 
         # Timestamp for the latest close (Open time of last kline)
         try:
-            ts = datetime.datetime.fromtimestamp(klines[-1][0] / 1000.0)
-            ts_str = ts.strftime("%Y-%m-%d %H:%M:%S")
+            ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(klines[-1][0] // 1000))
         except Exception:
-            ts_str = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+            ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
 
         return symbol, roc, ts_str
 
@@ -4,11 +4,79 @@ Calculates the 14-period Relative Strength Index (RSI) on the 1h timeframe to me
 Usage: python rsi_calculator_1h.py --symbol BTC
 """
 import argparse
+import json
+import os
 import sys
-import datetime
+import time
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
+CACHE_DIR = "."  # closed-candle cache location; can be changed if needed
+HOUR_MS = 3_600_000
+
+def load_cached_closes(cache_path):
+    """Return (last_open_time, closes) for the cached closed 1h candles, or None."""
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+        return int(cached["last_open_time"]), [float(c) for c in cached["closes"]]
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable cache {cache_path}: {e}", file=sys.stderr)
+        return None
+
+def save_cached_closes(cache_path, last_open_time, closes):
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps({"last_open_time": last_open_time, "closes": closes}, separators=(",", ":")))
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: Failed to write cache {cache_path}: {e}", file=sys.stderr)
+
+def fetch_closes(client, symbol, limit):
+    """
+    Returns (closes, last_open_time_ms) for the latest `limit` 1h candles; the last
+    candle is still forming. Closed candles are cached per symbol, so a warm run only
+    downloads the candles opened since the previous run.
+    """
+    cache_path = os.path.join(CACHE_DIR, f"rsi_{symbol}_1h_cache.json")
+    closes = None
+    cached = load_cached_closes(cache_path)
+    if cached is not None:
+        last_open_time, closes = cached
+        start_time = last_open_time + HOUR_MS
+        klines = client.get_klines(
+            symbol=symbol,
+            interval=Client.KLINE_INTERVAL_1HOUR,
+            startTime=start_time,
+            limit=limit
+        )
+        # A gap or a full page means the cache cannot be bridged; refetch the whole window
+        if klines and int(klines[0][0]) == start_time and len(klines) < limit:
+            closes.extend(float(k[4]) for k in klines)
+        else:
+            closes = None
+
+    if closes is None:
+        klines = client.get_klines(
+            symbol=symbol,
+            interval=Client.KLINE_INTERVAL_1HOUR,
+            limit=limit
+        )
+        if not klines:
+            return [], None
+        # Extract closing prices (Index 4 in Binance kline response)
+        # Kline format: [Open Time, Open, High, Low, Close, Volume, Close Time, ...]
+        closes = [float(k[4]) for k in klines]
+
+    closes = closes[-limit:]
+    last_open_time_ms = int(klines[-1][0])
+    # Everything but the newest candle is closed and will not change any more
+    save_cached_closes(cache_path, last_open_time_ms - HOUR_MS, closes[:-1])
+    return closes, last_open_time_ms
+
 def calculate_rsi(closes, period=14):
     """
     Calculates RSI using Wilder's Smoothing Method.
@@ -17,7 +85,7 @@ def calculate_rsi(closes, period=14):
         return None
 
     # Calculate differences
-    deltas = [closes[i] - closes[i-1] for i in range(1, len(closes))]
+    deltas = [cur - prev for prev, cur in zip(closes, closes[1:])]
 
     # Get initial seed averages (SMA of first 14 periods)
     seed_deltas = deltas[:period]
@@ -30,12 +98,16 @@ def calculate_rsi(closes, period=14):
 
     # Apply Wilder's Smoothing for the rest of the data
     # Formula: (Previous Avg * 13 + Current Gain/Loss) / 14
+    # This is a first-order recursive filter; a positive delta only feeds the
+    # gain average and decays the loss average, and vice versa.
+    decay = period - 1
     for delta in deltas[period:]:
-        gain = delta if delta > 0 else 0
-        loss = abs(delta) if delta < 0 else 0
-        
-        avg_gain = (avg_gain * (period - 1) + gain) / period
-        avg_loss = (avg_loss * (period - 1) + loss) / period
+        if delta > 0:
+            avg_gain = (avg_gain * decay + delta) / period
+            avg_loss = (avg_loss * decay) / period
+        else:
+            avg_gain = (avg_gain * decay) / period
+            avg_loss = (avg_loss * decay - delta) / period
 
     # Calculate RS and RSI
     if avg_loss == 0:
@@ -68,21 +140,12 @@ def main():
         client = Client("", "")
 
         # Fetch 100 candles to ensure Wilder's smoothing stabilizes
-        # 1h Interval
-        klines = client.get_klines(
-            symbol=symbol, 
-            interval=Client.KLINE_INTERVAL_1HOUR, 
-            limit=100
-        )
+        # 1h Interval (closed candles come from the cache)
+        closes, last_close_time_ms = fetch_closes(client, symbol, 100)
 
-        if not klines or len(klines) < 15:
+        if len(closes) < 15:
             print(f"Error: Insufficient data fetched for symbol '{symbol}'.")
             sys.exit(1)
-
-        # Extract closing prices (Index 4 in Binance kline response)
-        # Kline format: [Open Time, Open, High, Low, Close, Volume, Close Time, ...]
-        closes = [float(k[4]) for k in klines]
-        last_close_time_ms = klines[-1][0]
         
         # Calculate RSI
         rsi_value = calculate_rsi(closes)
@@ -95,7 +158,7 @@ def main():
         condition = get_condition(rsi_value)
         
         # Format Timestamp
-        timestamp = datetime.datetime.fromtimestamp(last_close_time_ms / 1000).strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(last_close_time_ms // 1000))
 
         # Output Result
         # JSON-like structure or aligned text as requested
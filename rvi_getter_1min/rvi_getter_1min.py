@@ -11,10 +11,16 @@ Notes:
 """
 
 import argparse
+import re
 import sys
-from datetime import datetime
+import time
+from operator import itemgetter
 from binance.client import Client
 
+SYMBOL_RE = re.compile(r"[A-Z0-9]{1,20}")
+
+_get_oc = itemgetter(1, 4)  # open, close fields of a kline row
+
 def resolve_symbol(symbol: str) -> str:
     s = symbol.strip().upper()
     if s.endswith("USDT") or s.endswith("USDC") or s.endswith("BUSD"):
@@ -28,7 +34,10 @@ def main():
     parser.add_argument('--n', type=int, default=10, help='Number of candles to use for RVI calculation (default: 10)')
     args = parser.parse_args()
 
-    symbol = resolve_symbol(args.symbol)
+    base = args.symbol.strip().upper()
+    if not SYMBOL_RE.fullmatch(base):
+        parser.error(f"invalid symbol '{args.symbol}'")
+    symbol = resolve_symbol(base)
     n = int(args.n)
     if n <= 0:
         print("Error: n must be a positive integer", file=sys.stderr)
@@ -46,30 +55,24 @@ def main():
         print(f"Insufficient candle data for symbol '{symbol}': requested {n}, got {got}", file=sys.stderr)
         sys.exit(2)
 
-    diffs = []
-    times_ms = []
+    # Exactly n candles were requested and validated above, so the whole
+    # response is the window: accumulate both sums while parsing.
+    sum_diff = 0.0
+    sum_abs = 0.0
     for k in candles:
-        # k[0]: open time in ms, k[1]: open, k[4]: close
         try:
-            o = float(k[1])
-            c = float(k[4])
-            t = int(k[0])
+            o, c = _get_oc(k)
+            o = float(o)
+            c = float(c)
         except (ValueError, TypeError) as e:
             print(f"Data parsing error: {e}", file=sys.stderr)
             sys.exit(4)
-        diffs.append(c - o)
-        times_ms.append(t)
+        d = c - o
+        sum_diff += d
+        sum_abs += d if d >= 0 else -d
 
-    # Compute RVI using the last window of size n
     window = n
-    if len(diffs) < window:
-        print(f"Error: not enough data to compute RVI with window {window}", file=sys.stderr)
-        sys.exit(5)
-
-    sum_diff = sum(diffs[-window:])
     sma_diff = sum_diff / window
-
-    sum_abs = sum(abs(d) for d in diffs[-window:])
     sma_abs = sum_abs / window
 
     if sma_abs == 0:
@@ -77,8 +80,11 @@ def main():
     else:
         rvi_last = 100.0 * (sma_diff / sma_abs)
 
-    time_last = datetime.fromtimestamp(times_ms[-1] / 1000.0)
-    time_str = time_last.strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        time_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(int(candles[-1][0]) // 1000))
+    except (ValueError, TypeError) as e:
+        print(f"Data parsing error: {e}", file=sys.stderr)
+        sys.exit(4)
 
     print(f"Symbol: {symbol} | Time: {time_str} | RVI(1m, N={n}): {rvi_last:.6f}")
 
@@ -4,11 +4,77 @@ Calculates the 200-period Simple Moving Average on the 1h timeframe
 Usage: python sma_calculator_1h.py --symbol BTC
 """
 import argparse
+import os
 import sys
 import json
+from operator import itemgetter
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
+CACHE_DIR = "."  # closed-candle cache location; can be changed if needed
+HOUR_MS = 3_600_000
+SMA_PERIOD = 200
+
+def load_cached_closes(cache_path: str):
+    """Return (last_open_time, closes) for the cached closed 1h candles, or None."""
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+        return int(cached["last_open_time"]), [float(c) for c in cached["closes"]]
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable cache {cache_path}: {e}", file=sys.stderr)
+        return None
+
+def save_cached_closes(cache_path: str, last_open_time: int, closes) -> None:
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps({"last_open_time": last_open_time, "closes": closes}, separators=(",", ":")))
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: Failed to write cache {cache_path}: {e}", file=sys.stderr)
+
+def fetch_closes(client: Client, symbol: str, limit: int):
+    """
+    Return the closes of the latest `limit` 1h candles, the last of which is still forming.
+    Closed candles are cached per symbol, so a warm run only downloads the candles
+    opened since the previous run instead of the whole window.
+    """
+    cache_path = os.path.join(CACHE_DIR, f"sma_{symbol}_1h_cache.json")
+    closes = None
+    cached = load_cached_closes(cache_path)
+    if cached is not None:
+        last_open_time, closes = cached
+        start_time = last_open_time + HOUR_MS
+        klines = client.get_klines(
+            symbol=symbol,
+            interval=Client.KLINE_INTERVAL_1HOUR,
+            startTime=start_time,
+            limit=limit
+        )
+        # A gap or a full page means the cache cannot be bridged; refetch the whole window
+        if klines and int(klines[0][0]) == start_time and len(klines) < limit:
+            closes.extend(map(float, map(itemgetter(4), klines)))
+        else:
+            closes = None
+
+    if closes is None:
+        # klines format: [Open time, Open, High, Low, Close, Volume, ...]
+        klines = client.get_klines(
+            symbol=symbol,
+            interval=Client.KLINE_INTERVAL_1HOUR,
+            limit=limit
+        )
+        closes = list(map(float, map(itemgetter(4), klines)))
+
+    closes = closes[-limit:]
+    if klines:
+        # Everything but the newest candle is closed and will not change any more
+        save_cached_closes(cache_path, int(klines[-1][0]) - HOUR_MS, closes[:-1])
+    return closes
+
 def main():
     # Input Parsing & Validation
     parser = argparse.ArgumentParser(description='Calculate 200 SMA on 1h timeframe')
@@ -26,21 +92,15 @@ def main():
         # Data Acquisition: Connect to Binance Public API
         client = Client("", "") # No authentication required for public data
 
-        # Fetch the most recent 200 candles for 1h timeframe
-        # klines format: [Open time, Open, High, Low, Close, Volume, ...]
-        klines = client.get_klines(
-            symbol=symbol,
-            interval=Client.KLINE_INTERVAL_1HOUR,
-            limit=200
-        )
+        # Fetch the most recent 200 candles for 1h timeframe (closed candles come from the cache)
+        closes = fetch_closes(client, symbol, SMA_PERIOD)
 
         # Validation: Ensure we received enough data
-        if len(klines) < 200:
-            raise ValueError(f"Insufficient data: Retrieved {len(klines)} candles, expected 200.")
+        if len(closes) < SMA_PERIOD:
+            raise ValueError(f"Insufficient data: Retrieved {len(closes)} candles, expected {SMA_PERIOD}.")
 
-        # Calculation Logic: Extract Close prices (index 4) and compute SMA
-        close_prices = [float(candle[4]) for candle in klines]
-        sma_200 = sum(close_prices) / len(close_prices)
+        # Calculation Logic: mean of the close prices
+        sma_200 = sum(closes) / len(closes)
 
         # Output Generation
         result = {
@@ -16,6 +16,8 @@ Notes:
 
 import argparse
 import sys
+from collections import deque
+from operator import itemgetter
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 
@@ -45,49 +47,58 @@ def fetch_klines(client: Client, pair: str, limit: int):
         raise RuntimeError(f"Failed to fetch klines: {e}") from e
 
 def to_float_closes(klines):
-    closes = []
-    for k in klines:
-        try:
-            closes.append(float(k[4]))
-        except Exception as e:
-            raise ValueError(f"Invalid klines payload: {e}")
-    return closes
+    try:
+        return list(map(float, map(itemgetter(4), klines)))
+    except Exception as e:
+        raise ValueError(f"Invalid klines payload: {e}")
 
 def ema_series(prices, period):
     if period <= 0 or not prices:
         return []
     alpha = 2.0 / (period + 1)
-    emas = []
     ema = prices[0]
-    emas.append(ema)
+    emas = [ema]
+    append = emas.append
     for p in prices[1:]:
-        ema = alpha * p + (1 - alpha) * ema
-        emas.append(ema)
+        ema += alpha * (p - ema)
+        append(ema)
     return emas
 
 def compute_stc_series(closes):
     # MACD line: EMA(23) - EMA(50)
     ema23 = ema_series(closes, 23)
     ema50 = ema_series(closes, 50)
-    min_len = min(len(ema23), len(ema50))
-    if min_len <= 0:
+    if not ema23:
         return [], []
-    macd = [ema23[-min_len + i] - ema50[-min_len + i] for i in range(min_len)]
+    # ema_series returns one value per input price, so the two EMAs are already aligned
+    macd = [a - b for a, b in zip(ema23, ema50)]
     macd_s = ema_series(macd, 10)
 
     # Stochastic of MACD_S: K with n=14
+    # Rolling min/max over the last n values come from monotonic deques of indices
+    # (amortised O(1) per step instead of rescanning an n-wide slice)
     n = 14
     K = []
-    for i in range(len(macd_s)):
-        win_start = max(0, i - n + 1)
-        window = macd_s[win_start:i+1]
-        min_v = min(window)
-        max_v = max(window)
+    min_idx = deque()
+    max_idx = deque()
+    for i, v in enumerate(macd_s):
+        while min_idx and macd_s[min_idx[-1]] >= v:
+            min_idx.pop()
+        min_idx.append(i)
+        while max_idx and macd_s[max_idx[-1]] <= v:
+            max_idx.pop()
+        max_idx.append(i)
+        if min_idx[0] <= i - n:
+            min_idx.popleft()
+        if max_idx[0] <= i - n:
+            max_idx.popleft()
+        min_v = macd_s[min_idx[0]]
+        max_v = macd_s[max_idx[0]]
         denom = max_v - min_v
         if denom == 0:
             k = 50.0
         else:
-            k = ((macd_s[i] - min_v) / denom) * 100.0
+            k = ((v - min_v) / denom) * 100.0
         K.append(k)
 
     # Schaff Trend Cycle: EMA(K, m) with m=3
@@ -6,6 +6,7 @@ Usage: python stddev_getter_1min.py --symbol BTC
 import argparse
 import sys
 import math
+from operator import itemgetter
 from binance.client import Client
 
 def normalize_symbol(symbol: str) -> str:
@@ -21,17 +22,13 @@ def normalize_symbol(symbol: str) -> str:
     return s
 
 def compute_sample_stddev(values):
-    n = 0
-    mean = 0.0
-    M2 = 0.0
-    for x in values:
-        n += 1
-        delta = x - mean
-        mean += delta / n
-        delta2 = x - mean
-        M2 += delta * delta2
+    # Two-pass formula (mean first, then squared deviations), as np.std does;
+    # math.fsum keeps both sums exactly rounded and runs in C
+    n = len(values)
     if n < 2:
         raise ValueError("At least two data points are required to compute sample stddev.")
+    mean = math.fsum(values) / n
+    M2 = math.fsum([(x - mean) * (x - mean) for x in values])
     variance = M2 / (n - 1)
     return math.sqrt(variance)
 
@@ -62,14 +59,11 @@ def main():
         print(f"Error: Insufficient data for symbol {symbol_pair}. Requested: {window} points, got: {len(klines) if klines else 0}", file=sys.stderr)
         sys.exit(1)
 
-    closes = []
-    for kline in klines:
-        close_str = kline[4]
-        try:
-            closes.append(float(close_str))
-        except Exception:
-            print(f"Error: Non-numeric close price encountered: {close_str}", file=sys.stderr)
-            sys.exit(2)
+    try:
+        closes = list(map(float, map(itemgetter(4), klines)))
+    except Exception as e:
+        print(f"Error: Non-numeric close price encountered: {e}", file=sys.stderr)
+        sys.exit(2)
 
     if len(closes) < 2:
         print(f"Error: Insufficient close data after parsing. Need at least 2 values.", file=sys.stderr)
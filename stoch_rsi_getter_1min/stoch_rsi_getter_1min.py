@@ -15,9 +15,12 @@ import sys
 import time
 import math
 from datetime import datetime
+from operator import itemgetter
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
+INVALID_SYMBOL_CODE = -1121  # Binance API error code for "Invalid symbol."
+
 def fetch_klines_with_retry(client, symbol, limit=200, max_retries=5, backoff=1.0):
     """
     Fetch klines with retries to handle rate limits and transient network errors.
@@ -32,6 +35,10 @@ def fetch_klines_with_retry(client, symbol, limit=200, max_retries=5, backoff=1.
                 raise BinanceAPIException("No klines data returned for symbol {}".format(symbol))
             return klines
         except (BinanceAPIException, BinanceRequestException) as e:
+            # An unknown symbol (-1121) will not succeed on retry; fail fast so the
+            # caller can move on to its next candidate without sitting through backoff
+            if getattr(e, 'code', None) == INVALID_SYMBOL_CODE:
+                raise
             # Binance API errors (including 429) may require backoff
             attempt += 1
             if attempt >= max_retries:
@@ -79,39 +86,29 @@ def calculate_rsi(prices, period=14):
         rs = average_gain / average_loss
         rsis.append(100.0 - (100.0 / (1.0 + rs)))
 
-    # Remaining RSI values
-    for i in range(period + 1, len(prices)):
-        delta = prices[i] - prices[i - 1]
-        gain = delta if delta > 0 else 0.0
-        loss = -delta if delta < 0 else 0.0
-
-        average_gain = (average_gain * (period - 1) + gain) / period
-        average_loss = (average_loss * (period - 1) + loss) / period
+    # Remaining RSI values (Wilder smoothing): a rise only feeds the gain average
+    # and decays the loss average, and vice versa
+    decay = period - 1
+    append = rsis.append
+    prev = prices[period]
+    for price in prices[period + 1:]:
+        delta = price - prev
+        prev = price
+        if delta > 0:
+            average_gain = (average_gain * decay + delta) / period
+            average_loss = (average_loss * decay) / period
+        else:
+            average_gain = (average_gain * decay) / period
+            average_loss = (average_loss * decay - delta) / period
 
         if average_loss == 0:
-            rsis.append(100.0)
+            append(100.0)
         else:
             rs = average_gain / average_loss
-            rsis.append(100.0 - (100.0 / (1.0 + rs)))
+            append(100.0 - (100.0 / (1.0 + rs)))
 
     return rsis
 
-def k_for_window(rsis, end_idx):
-    """
-    Compute K value for the RSI window ending at end_idx (inclusive).
-    Window is rsis[end_idx-13:end_idx+1] (14 values).
-    """
-    if end_idx < 13:
-        return None
-    window = rsis[end_idx - 13:end_idx + 1]
-    min_r = min(window)
-    max_r = max(window)
-    curr = rsis[end_idx]
-    denom = max_r - min_r
-    if denom == 0:
-        return 0.0
-    return (curr - min_r) / denom * 100.0
-
 def main():
     parser = argparse.ArgumentParser(description="Calculate current Stochastic RSI on 1-minute timeframe from Binance free API.")
     parser.add_argument('--symbol', required=True, help='Trading symbol (e.g., BTCUSDT or BTC)')
@@ -151,17 +148,13 @@ def main():
         sys.exit(1)
 
     # Extract closes and close times
-    closes = []
-    close_times_ms = []
-    for k in klines:
-        # kline: [Open time, Open, High, Low, Close, Volume, Close time, ...]
-        try:
-            close = float(k[4])
-            closes.append(close)
-            close_times_ms.append(int(k[6]))
-        except Exception:
-            sys.stderr.write("Error parsing kline data. Aborting.\n")
-            sys.exit(1)
+    # kline: [Open time, Open, High, Low, Close, Volume, Close time, ...]
+    try:
+        closes = list(map(float, map(itemgetter(4), klines)))
+        last_close_time_ms = int(klines[-1][6])
+    except Exception:
+        sys.stderr.write("Error parsing kline data. Aborting.\n")
+        sys.exit(1)
 
     if len(closes) < 15:
         sys.stderr.write("Error: not enough data to compute RSI (need at least 15 closes, have {})\n".format(len(closes)))
@@ -175,33 +168,34 @@ def main():
         sys.exit(1)
 
     current_rsi = rsis[-1]
-    last14 = rsis[-14:]
-    rsi_min_last14 = min(last14)
-    rsi_max_last14 = max(last14)
+    n_rsi = len(rsis)
+
+    # Stochastic K over the 14-value RSI windows ending at each of the last three RSIs.
+    # Those windows all contain the 12 values rsis[-14:-2], so the min/max of that core
+    # is taken once and each window only adds its two outer values.
+    core = rsis[-14:-2]
+    core_min = min(core)
+    core_max = max(core)
+    k_values = []  # most recent first
+    for back in range(min(3, n_rsi - 13)):
+        end = n_rsi - 1 - back
+        edges = rsis[end - 13:n_rsi - 14] + rsis[n_rsi - 2:end + 1]
+        min_r = min(core_min, *edges)
+        max_r = max(core_max, *edges)
+        if back == 0:
+            rsi_min_last14 = min_r
+            rsi_max_last14 = max_r
+        denom = max_r - min_r
+        if denom == 0:
+            k_values.append(0.0)
+        else:
+            k_values.append((rsis[end] - min_r) / denom * 100.0)
 
-    if rsi_max_last14 - rsi_min_last14 == 0:
-        stoch_k_current = 0.0
-    else:
-        stoch_k_current = (current_rsi - rsi_min_last14) / (rsi_max_last14 - rsi_min_last14) * 100.0
-
-    # Compute D as SMA of last up to 3 K values
-    ends_to_consider = [len(rsis) - 1, len(rsis) - 2, len(rsis) - 3]
-    k_values = []
-    for end in ends_to_consider:
-        if end >= 13:
-            k_val = k_for_window(rsis, end)
-            if k_val is not None:
-                k_values.append(k_val)
-
-    if not k_values:
-        stoch_d_current = 0.0
-    else:
-        # D as average of up to last 3 K values (most recent first in k_values)
-        last_n = min(3, len(k_values))
-        stoch_d_current = sum(k_values[:last_n]) / last_n
+    stoch_k_current = k_values[0]
+    # D as average of up to last 3 K values
+    stoch_d_current = sum(k_values) / len(k_values)
 
     # Time info: use last candle's close time
-    last_close_time_ms = close_times_ms[-1]
     dt = datetime.utcfromtimestamp(last_close_time_ms / 1000.0)
     time_str = dt.strftime('%Y-%m-%dT%H:%M:%SZ')
 
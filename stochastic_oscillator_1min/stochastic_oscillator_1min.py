@@ -28,12 +28,29 @@ Indicators: Stochastic Oscillator
 
 import argparse
 import json
+import os
 import time
 from datetime import datetime
 
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
+    _loads = json.loads
+
+CACHE_DIR = "."  # symbol-list cache location; can be changed if needed
+SYMBOL_CACHE_TTL = 24 * 60 * 60  # seconds before the cached symbol list is refreshed
+
 def normalize_symbol(input_symbol: str) -> str:
     s = input_symbol.strip().upper()
     if s.endswith("USDT"):
@@ -41,19 +58,38 @@ def normalize_symbol(input_symbol: str) -> str:
     # If user provides a base asset like BTC, assume BTCUSDT
     return s + "USDT"
 
+def load_symbol_set(client: Client, max_age: float = SYMBOL_CACHE_TTL) -> frozenset:
+    """
+    Return the set of Binance symbols, read from an on-disk cache younger than max_age
+    seconds, or fetched from exchangeInfo (and re-cached) otherwise.
+    """
+    cache_path = os.path.join(CACHE_DIR, "binance_symbols_cache.json")
+    try:
+        if time.time() - os.path.getmtime(cache_path) < max_age:
+            with open(cache_path, "rb") as f:
+                return frozenset(_loads(f.read()))
+    except (OSError, ValueError):
+        pass  # missing or unreadable cache: fall through to a fresh fetch
+
+    info = client.get_exchange_info()
+    symbols = [s.get("symbol") for s in info.get("symbols", [])]
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(symbols, separators=(",", ":")))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # caching is best effort
+    return frozenset(symbols)
+
 def validate_symbol(client: Client, symbol: str) -> bool:
     try:
-        # Try to fetch symbol info directly (best effort)
-        client.get_symbol_info(symbol)
-        return True
+        if symbol in load_symbol_set(client):
+            return True
+        # The cached list may predate a new listing, so confirm a miss against a fresh copy
+        return symbol in load_symbol_set(client, max_age=0)
     except Exception:
-        # Fallback: check in exchange info symbols list
-        try:
-            info = client.get_exchange_info()
-            symbols = [s.get("symbol") for s in info.get("symbols", [])]
-            return symbol in symbols
-        except Exception:
-            return False
+        return False
 
 def fetch_klines_with_retries(client: Client, symbol: str, interval: str, limit: int, retries: int = 3, backoff: float = 1.0):
     for attempt in range(1, retries + 1):
@@ -80,11 +116,11 @@ def main():
     try:
         pair = normalize_symbol(args.symbol)
     except Exception as e:
-        print(json.dumps({"error": f"Invalid symbol input: {e}"}))
+        print(_dumps({"error": f"Invalid symbol input: {e}"}))
         raise SystemExit(1)
 
     if not validate_symbol(client, pair):
-        print(json.dumps({"error": f"Symbol '{pair}' not found on Binance. Ensure the pair exists (e.g., BTCUSDT)."}))
+        print(_dumps({"error": f"Symbol '{pair}' not found on Binance. Ensure the pair exists (e.g., BTCUSDT)."}))
         raise SystemExit(1)
 
     # Fetch latest klines (1 minute, limit 200)
@@ -98,65 +134,54 @@ def main():
             backoff=1.0,
         )
     except Exception as e:
-        print(json.dumps({"error": f"Failed to fetch klines: {e}"}))
+        print(_dumps({"error": f"Failed to fetch klines: {e}"}))
         raise SystemExit(1)
 
     if not klines or len(klines) < 14:
-        print(json.dumps({"error": "Insufficient kline data received. Need at least 14 bars."}))
+        print(_dumps({"error": "Insufficient kline data received. Need at least 14 bars."}))
         raise SystemExit(1)
 
     N = 14
-    M = len(klines)
-
-    # Prepare arrays
-    K_fast = [None] * M
-    D_fast = [None] * M
-    D_slow = [None] * M  # SMA of D_fast over last 3 bars
 
-    # Compute K_fast for each end index from N-1 to M-1
+    # Only the last N + 4 bars feed the latest slow %D (3 D_fast values, each over
+    # 3 K_fast values, each over N bars), so parse just those, and only once each
+    window = klines[-(N + 4):]
+    M = len(window)
+    columns = list(zip(*window))
+    highs = list(map(float, columns[2]))
+    lows = list(map(float, columns[3]))
+    closes = list(map(float, columns[4]))
+
+    # Compute K_fast for each end index from N-1 to M-1 (K_fast[j] ends at bar N-1+j)
+    K_fast = []
     for end in range(N - 1, M):
-        window = klines[end - N + 1 : end + 1]  # 14 bars ending at 'end'
-        lows = [float(bar[3]) for bar in window]
-        highs = [float(bar[2]) for bar in window]
-        closes = float(window[-1][4])
-
-        minLow14 = min(lows)
-        maxHigh14 = max(highs)
+        start = end - N + 1  # 14 bars ending at 'end'
+        minLow14 = min(lows[start:end + 1])
+        maxHigh14 = max(highs[start:end + 1])
         denom = maxHigh14 - minLow14
 
         if denom == 0:
             k_val = 0.0
         else:
-            k_val = 100.0 * (closes - minLow14) / denom
-
-        K_fast[end] = k_val
+            k_val = 100.0 * (closes[end] - minLow14) / denom
 
-    # Compute D_fast = SMA(K_fast, 3)
-    for end in range(N - 1, M):
-        if None in (K_fast[end - 2], K_fast[end - 1], K_fast[end]):
-            D_fast[end] = None
-        else:
-            D_fast[end] = (K_fast[end - 2] + K_fast[end - 1] + K_fast[end]) / 3.0
+        K_fast.append(k_val)
 
-    # Compute D_slow = SMA(D_fast, 3)
-    for end in range(N - 1, M):
-        if None in (D_fast[end - 2], D_fast[end - 1], D_fast[end]):
-            D_slow[end] = None
-        else:
-            D_slow[end] = (D_fast[end - 2] + D_fast[end - 1] + D_fast[end]) / 3.0
+    # D_fast = SMA(K_fast, 3) and D_slow = SMA(D_fast, 3); both series end at the latest bar
+    D_fast = [(a + b + c) / 3.0 for a, b, c in zip(K_fast, K_fast[1:], K_fast[2:])]
+    D_slow = [(a + b + c) / 3.0 for a, b, c in zip(D_fast, D_fast[1:], D_fast[2:])]
 
-    latest = M - 1
-    if None in (K_fast[latest], D_fast[latest], D_slow[latest]):
-        print(json.dumps({"error": "Insufficient data to compute all stochastic values for the latest bar."}))
+    if not D_slow:
+        print(_dumps({"error": "Insufficient data to compute all stochastic values for the latest bar."}))
         raise SystemExit(1)
 
-    fastK = float(K_fast[latest])
-    fastD = float(D_fast[latest])
-    slowK = float(D_fast[latest])  # slow %K equals D_fast
-    slowD = float(D_slow[latest])
+    fastK = K_fast[-1]
+    fastD = D_fast[-1]
+    slowK = D_fast[-1]  # slow %K equals D_fast
+    slowD = D_slow[-1]
 
     # Time corresponding to the latest candle (Close time)
-    close_time_ms = klines[latest][6]
+    close_time_ms = klines[-1][6]
     time_str = datetime.utcfromtimestamp(close_time_ms / 1000.0).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     output = {
@@ -168,7 +193,7 @@ def main():
         "slowD": round(slowD, 6)
     }
 
-    print(json.dumps(output))
+    print(_dumps(output))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,6 +7,7 @@ Usage example: python trix_getter_1min.py --symbol BTC
 import argparse
 import sys
 from datetime import datetime
+from operator import itemgetter
 
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
@@ -25,46 +26,30 @@ def fetch_klines(client: Client, pair: str, limit: int = 1000):
         raise RuntimeError(f"Network or other error while fetching data: {e}")
 
 
-def compute_ema(values, period: int):
-    """
-    Simple EMA implementation (seed with first value).
-    """
-    if period <= 0 or not values:
-        return []
-    k = 2.0 / (period + 1)
-    emas = []
-    ema_prev = None
-    for i, v in enumerate(values):
-        if i == 0:
-            ema = v
-        else:
-            ema = v * k + ema_prev * (1 - k)
-        emas.append(ema)
-        ema_prev = ema
-    return emas
-
-
 def compute_trix(closes, period: int = 15):
     """
     Compute TRIX values given close prices and EMA period.
     Returns a tuple: (trix_list, e3_values)
     trix_list contains None for positions where not enough data to compute.
     """
-    e1 = compute_ema(closes, period)
-    e2 = compute_ema(e1, period)
-    e3 = compute_ema(e2, period)
-
-    trix = []
-    for i in range(len(e3)):
-        if i == 0:
-            trix.append(None)
-        else:
-            prev = e3[i - 1]
-            cur = e3[i]
-            if prev is None or cur is None or prev == 0:
-                trix.append(None)
-            else:
-                trix.append(((cur - prev) / prev) * 100.0)
+    if period <= 0 or not closes:
+        return [], []
+    # Triple EMA (each stage seeded with the first close) in a single pass:
+    # the three stages are chained per bar, so no e1/e2 series is materialized,
+    # and the one-bar rate of change of e3 is taken in the same step
+    k = 2.0 / (period + 1)
+    e1 = e2 = e3_cur = closes[0]
+    e3 = [e3_cur]
+    trix = [None]
+    append_e3 = e3.append
+    append_trix = trix.append
+    for v in closes[1:]:
+        prev = e3_cur
+        e1 += k * (v - e1)
+        e2 += k * (e1 - e2)
+        e3_cur += k * (e2 - e3_cur)
+        append_e3(e3_cur)
+        append_trix(((e3_cur - prev) / prev) * 100.0 if prev != 0 else None)
     return trix, e3
 
 
@@ -95,13 +80,11 @@ def main():
         print("Invalid symbol, unable to fetch data", file=sys.stderr)
         sys.exit(1)
 
-    closes = []
-    for k in klines:
-        try:
-            closes.append(float(k[4]))
-        except (IndexError, ValueError):
-            print("Error parsing close prices from data", file=sys.stderr)
-            sys.exit(1)
+    try:
+        closes = list(map(float, map(itemgetter(4), klines)))
+    except (IndexError, ValueError):
+        print("Error parsing close prices from data", file=sys.stderr)
+        sys.exit(1)
 
     # Ensure enough history for TRIX: need at least 3*n + 1 points
     n = 15
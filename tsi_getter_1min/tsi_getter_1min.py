@@ -12,6 +12,7 @@ Note:
 import argparse
 import sys
 from datetime import datetime
+from operator import itemgetter
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
@@ -28,15 +29,23 @@ def normalize_symbol(symbol: str) -> str:
         return s + "USDT"
     return s
 
-def ema(series, period: int):
+def double_ema_last(series, period1: int, period2: int):
+    """
+    Return the last value of EMA(EMA(series, period1), period2), both stages seeded
+    with the first value. The stages are chained per element, so no intermediate
+    EMA list is built. Returns None for an empty series.
+    """
     if not series:
-        return []
-    alpha = 2.0 / (period + 1.0)
-    emas = [series[0]]
+        return None
+    alpha1 = 2.0 / (period1 + 1.0)
+    beta1 = 1.0 - alpha1
+    alpha2 = 2.0 / (period2 + 1.0)
+    beta2 = 1.0 - alpha2
+    ema1 = ema2 = series[0]
     for v in series[1:]:
-        next_val = alpha * v + (1.0 - alpha) * emas[-1]
-        emas.append(next_val)
-    return emas
+        ema1 = alpha1 * v + beta1 * ema1
+        ema2 = alpha2 * ema1 + beta2 * ema2
+    return ema2
 
 def fetch_klines(client: Client, symbol: str, limit: int):
     try:
@@ -84,58 +93,38 @@ def main():
         print(f"Error: Insufficient data points received. Required at least {min_points}, got {len(klines)}.")
         sys.exit(1)
 
-    # Extract closing prices and close times
-    closes = []
-    close_times = []
-    for k in klines:
-        # kline structure: [open_time, open, high, low, close, volume, close_time, ...]
-        try:
-            close = float(k[4])
-            close_time = int(k[6])
-        except (IndexError, ValueError, TypeError) as e:
-            print(f"Error: Malformed kline data encountered: {e}")
-            sys.exit(1)
-        closes.append(close)
-        close_times.append(close_time)
+    # Extract closing prices and the latest close time
+    # kline structure: [open_time, open, high, low, close, volume, close_time, ...]
+    try:
+        closes = list(map(float, map(itemgetter(4), klines)))
+        latest_close_time_ms = int(klines[-1][6])
+    except (IndexError, ValueError, TypeError) as e:
+        print(f"Error: Malformed kline data encountered: {e}")
+        sys.exit(1)
 
     if len(closes) < 2:
         print("Error: Not enough close prices to compute M series.")
         sys.exit(1)
 
     # Compute M[i] = close[i] - close[i-1]
-    M = []
-    for i in range(1, len(closes)):
-        M.append(closes[i] - closes[i-1])
-
-    M_abs = [abs(v) for v in M]
+    M = [cur - prev for prev, cur in zip(closes, closes[1:])]
+    M_abs = list(map(abs, M))
 
-    # EMA calculations
-    P1 = ema(M, P)
-    P2 = ema(M_abs, P)
-    T1 = ema(P1, Q)
-    T2 = ema(P2, Q)
+    # Double-smoothed EMAs; only the latest TSI is reported, so only the final values are kept
+    T1 = double_ema_last(M, P, Q)
+    T2 = double_ema_last(M_abs, P, Q)
 
-    if not T1 or not T2 or len(T1) != len(T2):
+    if T1 is None or T2 is None:
         print("Error: EMA computation produced unexpected results.")
         sys.exit(1)
 
     # Compute TSI = 100 * (T1 / T2)
-    tsi_values = []
-    for t1, t2 in zip(T1, T2):
-        if t2 == 0:
-            tsi = 0.0
-        else:
-            tsi = 100.0 * (t1 / t2)
-        tsi_values.append(tsi)
-
-    if not tsi_values:
-        print("Error: No TSI values computed.")
-        sys.exit(1)
-
-    tsi_latest = tsi_values[-1]
+    if T2 == 0:
+        tsi_latest = 0.0
+    else:
+        tsi_latest = 100.0 * (T1 / T2)
 
     # Latest timestamp (close time of the latest candle)
-    latest_close_time_ms = close_times[-1]
     latest_dt = datetime.fromtimestamp(latest_close_time_ms / 1000.0)
     latest_time_iso = latest_dt.isoformat(sep=' ')
 
@@ -6,22 +6,31 @@ Usage: python ulcer_index_getter_1min.py --symbol BTC
 import argparse
 import sys
 import json
-import datetime
+import time
 from math import sqrt
 from binance.client import Client
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
 def compute_ui(closes):
     if not closes or len(closes) < 14:
         raise ValueError("Not enough close data points to compute UI (need 14).")
 
     peak = max(closes)
-    # Protect against division by zero
-    if peak == 0:
-        dd = [0.0 for _ in closes]
-    else:
-        dd = [(peak - c) / peak for c in closes]
-
-    sum_sq = sum(d * d for d in dd)
+    # Square and sum the drawdowns in one pass; a zero peak (no valid
+    # drawdown) contributes nothing and avoids a division by zero
+    sum_sq = 0.0
+    if peak != 0:
+        for c in closes:
+            d = (peak - c) / peak
+            sum_sq += d * d
     ui = sqrt(sum_sq / 14.0)
     return ui, peak
 
@@ -64,7 +73,7 @@ def main():
         sys.exit(1)
 
     # Timestamp in ISO-8601 (UTC)
-    timestamp = datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
     # Human-friendly output
     print(f"Symbol: {symbol}")
@@ -81,7 +90,7 @@ def main():
         "window": 14,
         "timestamp": timestamp
     }
-    print(json.dumps(payload))
+    print(_dumps(payload))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
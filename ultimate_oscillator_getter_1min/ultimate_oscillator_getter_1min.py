@@ -12,7 +12,8 @@ Notes:
 
 import argparse
 import sys
-from datetime import datetime
+import time
+from itertools import accumulate
 from binance.client import Client
 
 
@@ -50,13 +51,21 @@ def main():
         print(f"Error: Unable to retrieve data for symbol '{symbol_input}'. Tried common variants (e.g., {symbol_input.upper()}USDT).", file=sys.stderr)
         sys.exit(2)
 
-    # Parse klines into OHLC arrays
+    n = len(klines)
+
+    # Need at least 29 candles to compute the first Ultimate Oscillator value
+    if n < 29:
+        print(f"Error: Insufficient candles for calculation. Retrieved {n} candles for {symbol_used}. Need at least 29 candles.", file=sys.stderr)
+        sys.exit(3)
+
+    # Only the last 28 r-values feed the 7/14/28 averages, and each r-value also
+    # needs the previous close, so parse and process just the last 29 candles
     open_times = []
     highs = []
     lows = []
     closes = []
 
-    for k in klines:
+    for k in klines[-29:]:
         # Binance kline structure:
         # [OpenTime, Open, High, Low, Close, Volume, CloseTime, ...]
         open_times.append(int(k[0]))
@@ -64,21 +73,14 @@ def main():
         lows.append(float(k[3]))
         closes.append(float(k[4]))
 
-    n = len(closes)
-
-    # Need at least 29 candles to compute the first Ultimate Oscillator value
-    if n < 29:
-        print(f"Error: Insufficient candles for calculation. Retrieved {n} candles for {symbol_used}. Need at least 29 candles.", file=sys.stderr)
-        sys.exit(3)
-
     # Compute r-values as per Ultimate Oscillator
     r_values = []
-    for i in range(1, n):
-        prev_close = closes[i - 1]
-        bp = closes[i] - min(lows[i], prev_close)
-        tr = max(highs[i], prev_close) - min(lows[i], prev_close)
-        r = 0.0 if tr == 0 else bp / tr
-        r_values.append(r)
+    for prev_close, high, low, close in zip(closes, highs[1:], lows[1:], closes[1:]):
+        # Two-way min/max as conditional expressions rather than builtin calls
+        true_low = low if low < prev_close else prev_close
+        true_high = high if high > prev_close else prev_close
+        tr = true_high - true_low
+        r_values.append(0.0 if tr == 0 else (close - true_low) / tr)
 
     if len(r_values) < 28:
         print(f"Error: Not enough r-values to compute 28-period SMA. r_values={len(r_values)}", file=sys.stderr)
@@ -87,17 +89,17 @@ def main():
     # Latest UO corresponds to the latest available r index
     i = len(r_values) - 1  # r index, also corresponds to candle index for UO value
 
-    def sma(values, end_idx, window):
+    # Prefix sums of r: any window sum is then one subtraction instead of a slice and sum()
+    prefix = list(accumulate(r_values, initial=0.0))
+
+    def sma(end_idx, window):
         if end_idx - window + 1 < 0:
             return None
-        slice_vals = values[end_idx - window + 1 : end_idx + 1]
-        if not slice_vals:
-            return None
-        return sum(slice_vals) / window
+        return (prefix[end_idx + 1] - prefix[end_idx + 1 - window]) / window
 
-    avg7 = sma(r_values, i, 7)
-    avg14 = sma(r_values, i, 14)
-    avg28 = sma(r_values, i, 28)
+    avg7 = sma(i, 7)
+    avg14 = sma(i, 14)
+    avg28 = sma(i, 28)
 
     if avg7 is None or avg14 is None or avg28 is None:
         print("Error: Unable to compute SMAs due to insufficient data.", file=sys.stderr)
@@ -107,8 +109,7 @@ def main():
 
     # Timestamp for the UO value: use the candle corresponding to r index i
     ts_ms = open_times[i]
-    ts_dt = datetime.utcfromtimestamp(ts_ms / 1000.0)
-    ts_str = ts_dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+    ts_str = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime(ts_ms // 1000))
 
     print(f"Symbol {symbol_used} 1m UO: {uo:.2f} (as of {ts_str})")
 
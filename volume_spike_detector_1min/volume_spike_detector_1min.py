@@ -7,9 +7,19 @@ Usage: python volume_spike_detector_1min.py --symbol BTC
 import argparse
 import json
 import sys
-import datetime
+import time
+from operator import itemgetter
 from binance.client import Client
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
 def resolve_symbol(symbol_arg: str) -> str:
     s = symbol_arg.strip().upper()
     if not s:
@@ -23,7 +33,7 @@ def handle_error(message: str, code: int = None):
     err = {"error": message}
     if code is not None:
         err["code"] = code
-    sys.stderr.write(json.dumps(err) + "\n")
+    sys.stderr.write(_dumps(err) + "\n")
     sys.exit(1)
 
 def main():
@@ -55,7 +65,7 @@ def main():
         )
 
     try:
-        volumes = [float(k[5]) for k in klines]  # volume is at index 5
+        volumes = list(map(float, map(itemgetter(5), klines)))  # volume is at index 5
         close_time_ms = int(klines[-1][6])     # close time is at index 6
     except Exception as e:
         handle_error(f"Unexpected data format: parsing klines failed ({str(e)}).")
@@ -70,8 +80,7 @@ def main():
         ratio = 0.0
         spike = False
 
-    dt = datetime.datetime.utcfromtimestamp(close_time_ms / 1000.0)
-    timestamp = dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(close_time_ms // 1000))
 
     output = {
         "symbol": symbol_pair,
@@ -83,7 +92,7 @@ def main():
         "threshold": threshold
     }
 
-    print(json.dumps(output))
+    print(_dumps(output))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
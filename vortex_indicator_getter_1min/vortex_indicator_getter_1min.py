@@ -8,9 +8,20 @@ import argparse
 import json
 import sys
 from datetime import datetime, timezone
+from operator import itemgetter
 from binance.client import Client
 
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
+
 def resolve_symbol(input_symbol: str) -> str:
     s = input_symbol.strip().upper()
     if s.endswith('USDT'):
@@ -33,38 +44,28 @@ def compute_vi_from_klines(klines):
     if klines is None or len(klines) < 15:
         return None, None, None
 
-    highs = []
-    lows = []
-    closes = []
-    close_times = []
-
-    for k in klines:
-        highs.append(float(k[2]))
-        lows.append(float(k[3]))
-        closes.append(float(k[4]))
-        close_times.append(int(k[6]))
+    # Parse (High, Low, Close) once for just the 15 bars the indicator uses
+    get_hlc = itemgetter(2, 3, 4)
+    bars = [tuple(map(float, get_hlc(k))) for k in klines[:15]]
 
     sum_tr = 0.0
     sum_term_plus = 0.0
     sum_term_minus = 0.0
 
-    # i = 1..14
-    for i in range(1, 15):
-        H_i = highs[i]
-        L_i = lows[i]
-        C_i = closes[i]
-
-        H_prev = highs[i - 1]
-        L_prev = lows[i - 1]
-        C_prev = closes[i - 1]
-
-        TR_i = max(H_i - L_i, abs(H_i - C_prev), abs(L_i - C_prev))
-        term_plus_i = abs(H_i - L_prev)
-        term_minus_i = abs(L_i - H_prev)
-
+    # i = 1..14, each bar paired with the one before it
+    for (H_prev, L_prev, C_prev), (H_i, L_i, C_i) in zip(bars, bars[1:]):
+        # TR = max(H - L, |H - C_prev|, |L - C_prev|), unrolled into comparisons
+        # so no argument tuple is built for max() on every bar
+        TR_i = H_i - L_i
+        up = abs(H_i - C_prev)
+        if up > TR_i:
+            TR_i = up
+        down = abs(L_i - C_prev)
+        if down > TR_i:
+            TR_i = down
         sum_tr += TR_i
-        sum_term_plus += term_plus_i
-        sum_term_minus += term_minus_i
+        sum_term_plus += abs(H_i - L_prev)
+        sum_term_minus += abs(L_i - H_prev)
 
     if sum_tr == 0:
         vi_plus = float('nan')
@@ -73,7 +74,7 @@ def compute_vi_from_klines(klines):
         vi_plus = sum_term_plus / sum_tr
         vi_minus = sum_term_minus / sum_tr
 
-    as_of_ms = close_times[14]
+    as_of_ms = int(klines[14][6])
     as_of_dt = datetime.fromtimestamp(as_of_ms / 1000.0, tz=timezone.utc)
     as_of_iso = as_of_dt.isoformat().replace('+00:00', 'Z')
 
@@ -94,11 +95,11 @@ def main():
     try:
         klines = fetch_klines(client, symbol, limit=15)
     except Exception as e:
-        print(json.dumps({"error": f"Failed to fetch klines for symbol {symbol}: {str(e)}"}))
+        print(_dumps({"error": f"Failed to fetch klines for symbol {symbol}: {str(e)}"}))
         sys.exit(2)
 
     if not klines or len(klines) < 15:
-        print(json.dumps({"error": f"Insufficient candle data received for symbol {symbol}. "
+        print(_dumps({"error": f"Insufficient candle data received for symbol {symbol}. "
                                 f"Expected 15 candles, got {len(klines) if klines else 0}."}))
         sys.exit(3)
 
@@ -106,7 +107,7 @@ def main():
 
     # If Vi values are NaN (e.g., sum_tr == 0)
     if vi_plus != vi_plus or vi_minus != vi_minus:
-        print(json.dumps({"error": "VI calculation resulted in NaN values (possible sum(TR) == 0)."}))
+        print(_dumps({"error": "VI calculation resulted in NaN values (possible sum(TR) == 0)."}))
         sys.exit(4)
 
     output = {
@@ -117,7 +118,7 @@ def main():
         "vi_minus": vi_minus,
         "as_of": as_of_iso
     }
-    print(json.dumps(output))
+    print(_dumps(output))
 
 
 if __name__ == "__main__":
@@ -6,7 +6,6 @@ Usage: python vpt_getter_1min.py --symbol BTC
 
 import argparse
 import time
-from datetime import datetime
 from typing import Optional, Tuple
 
 from binance.client import Client
@@ -56,26 +55,30 @@ def compute_vpt(klines: list) -> float:
         return 0.0
 
     vpt = 0.0
-    # Start from index 1 to compute delta with previous close
-    for i in range(1, len(klines)):
+    # Each close is parsed once and carried forward as the next bar's previous
+    # close; None marks a previous close that failed to parse
+    close_prev = None
+    for k in klines:
         try:
-            close_i = float(klines[i][4])
-            close_prev = float(klines[i - 1][4])
-            vol_i = float(klines[i][5])
+            close_i = float(k[4])
         except (ValueError, IndexError):
-            # If parsing fails, skip this bar
+            # If parsing fails, skip this bar (and the next one, which has no previous close)
+            close_prev = None
             continue
 
-        if close_prev != 0.0:
-            delta = close_i - close_prev
-            vpt += vol_i * (delta / close_prev)
-        # If close_prev == 0, skip as per specification to avoid division by zero
+        # Skip the first bar, and a zero previous close as per specification
+        # to avoid division by zero
+        if close_prev:
+            try:
+                vpt += float(k[5]) * ((close_i - close_prev) / close_prev)
+            except (ValueError, IndexError):
+                pass
+        close_prev = close_i
     return vpt
 
 
 def ms_to_utc_str(ms: int) -> str:
-    dt = datetime.utcfromtimestamp(ms / 1000.0)
-    return dt.strftime("%Y-%m-%d %H:%M")
+    return time.strftime("%Y-%m-%d %H:%M", time.gmtime(ms // 1000))
 
 
 def main():
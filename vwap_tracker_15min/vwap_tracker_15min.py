@@ -6,6 +6,8 @@ Usage: python vwap_tracker_15min.py --symbol BTC
 import sys
 import argparse
 import json
+import math
+from operator import mul
 from datetime import datetime, timezone
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
@@ -48,22 +50,17 @@ def main():
             sys.exit(1)
 
         # 3. VWAP Calculation
-        cumulative_tp_v = 0.0
-        cumulative_v = 0.0
-
-        for k in klines:
-            # Parse necessary fields (High, Low, Close, Volume)
-            high = float(k[2])
-            low = float(k[3])
-            close = float(k[4])
-            volume = float(k[5])
-
-            # Calculate Typical Price
-            typical_price = (high + low + close) / 3.0
-
-            # Accumulate
-            cumulative_tp_v += (typical_price * volume)
-            cumulative_v += volume
+        # Transpose the klines once into columns (High, Low, Close, Volume), then
+        # reduce whole columns: sum(TP * V) is a dot product, sum(V) a plain sum
+        columns = list(zip(*klines))
+        volumes = list(map(float, columns[5]))
+        typical_prices = [
+            (float(high) + float(low) + float(close)) / 3.0
+            for high, low, close in zip(columns[2], columns[3], columns[4])
+        ]
+
+        cumulative_tp_v = math.fsum(map(mul, typical_prices, volumes))
+        cumulative_v = math.fsum(volumes)
 
         if cumulative_v == 0:
             print("Error: Total volume is zero, cannot calculate VWAP.")
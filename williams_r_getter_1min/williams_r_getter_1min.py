@@ -4,7 +4,7 @@ Fetches current Williams %R (14-period) for a given symbol on a 1-minute timefra
 Usage: python williams_r_getter_1min.py --symbol BTC
 """
 import argparse
-from datetime import datetime
+import time
 from binance.client import Client
 
 def main():
@@ -54,13 +54,13 @@ def main():
 
     # Extract 14 candles data
     try:
-        highs = [float(kline[2]) for kline in klines]
-        lows  = [float(kline[3]) for kline in klines]
+        # Transpose once and reduce the High/Low columns directly; no per-row lists
+        columns = list(zip(*klines))
         current_close = float(klines[-1][4])  # last candle's close
         close_time_ms = int(klines[-1][6])     # close time in milliseconds
 
-        HighestHigh = max(highs)
-        LowestLow = min(lows)
+        HighestHigh = max(map(float, columns[2]))
+        LowestLow = min(map(float, columns[3]))
 
         if HighestHigh == LowestLow:
             print("Error: Division by zero in Williams %R calculation (HighestHigh == LowestLow).")
@@ -69,8 +69,7 @@ def main():
         WilliamsR14 = (HighestHigh - current_close) / (HighestHigh - LowestLow) * (-100.0)
 
         # Timestamp formatting (UTC, ISO-like)
-        timestamp = datetime.utcfromtimestamp(close_time_ms / 1000.0)
-        timestamp_str = timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+        timestamp_str = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(close_time_ms // 1000))
 
         print("Symbol: {} | Williams %R(14,1m): {:.2f} | High: {:.2f} | Low: {:.2f} | Close: {:.2f} | Timestamp: {}".format(
             used_symbol,
@@ -6,9 +6,24 @@ Usage: python zscore_price_1min.py --symbol BTC
 import sys
 import argparse
 import math
+import time
+from operator import itemgetter
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 
+CLOSES_TTL = 15.0  # seconds a fetched close window is reused within one process
+_RECIPROCALS = tuple(1.0 / i for i in range(1, 21))  # 1/n for the Welford mean update, n = 1..20
+
+_client = None
+_closes_cache = {}  # symbol_pair -> (monotonic fetch time, closes)
+
+def get_client() -> Client:
+    """Return a process-wide Binance client so repeated calls reuse one HTTP session."""
+    global _client
+    if _client is None:
+        _client = Client("", "")
+    return _client
+
 def normalize_symbol(symbol: str) -> str:
     s = symbol.strip().upper()
     if not s:
@@ -18,52 +33,88 @@ def normalize_symbol(symbol: str) -> str:
     return s
 
 def fetch_last_20_closes(symbol_pair: str) -> list:
-    client = Client("", "")
+    # Repeated lookups of the same pair shortly after each other (e.g. callers of
+    # compute_zscore looping over symbols) reuse the last fetch instead of hitting the API
+    now = time.monotonic()
+    cached = _closes_cache.get(symbol_pair)
+    if cached is not None and now - cached[0] < CLOSES_TTL:
+        return cached[1]
+
+    client = get_client()
     try:
         klines = client.get_klines(symbol=symbol_pair, interval='1m', limit=20)
     except (BinanceAPIException, BinanceRequestException) as e:
         raise RuntimeError(f"Error fetching klines for {symbol_pair}: {e}")
-    closes = []
-    for k in klines:
-        try:
-            closes.append(float(k[4]))
-        except (IndexError, ValueError, TypeError) as e:
-            raise RuntimeError(f"Invalid klines data for {symbol_pair}: {e}")
-    if len(closes) < 20:
-        raise RuntimeError(f"Insufficient data: expected 20 closes, got {len(closes)}")
+    # Reject a short response before parsing any of it
+    if len(klines) < 20:
+        raise RuntimeError(f"Insufficient data: expected 20 closes, got {len(klines)}")
+    try:
+        closes = list(map(float, map(itemgetter(4), klines)))
+    except (IndexError, ValueError, TypeError) as e:
+        raise RuntimeError(f"Invalid klines data for {symbol_pair}: {e}")
+    _closes_cache[symbol_pair] = (now, closes)
     return closes
 
-def main():
-    parser = argparse.ArgumentParser(description="Compute Z-score of the last 20 1-minute closes for a symbol.")
-    parser.add_argument('--symbol', required=True, help='Trading symbol (e.g., BTC, ETH)')
-    args = parser.parse_args()
-    if not args.symbol or not isinstance(args.symbol, str) or args.symbol.strip() == "":
-        parser.error("Symbol must be a non-empty string.")
+def compute_zscore(symbol_pair: str) -> tuple:
+    """
+    Return (z, mean, std, latest) for the last 20 1-minute closes of symbol_pair.
+    z is 0.0 when the series is flat. Callers looping over many symbols can import
+    this and share the module's client (and its connection pool).
+    """
+    closes = fetch_last_20_closes(symbol_pair)
+
+    # Welford's online update: mean and sum of squared deviations (M2) in one pass
+    mean = 0.0
+    M2 = 0.0
+    for x, inv_n in zip(closes, _RECIPROCALS):
+        d = x - mean
+        mean += d * inv_n
+        M2 += d * (x - mean)
+    variance = M2 / 20.0
+    std = math.sqrt(variance)
+    latest = closes[-1]
+    z = (latest - mean) / std if std > 0 else 0.0
+    return z, mean, std, latest
 
-    input_symbol = args.symbol.strip()
+def report_zscore(input_symbol: str) -> int:
+    """Print the z-score line for one symbol; return the exit code for that symbol (0 on success)."""
     try:
         symbol_pair = normalize_symbol(input_symbol)
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
-        sys.exit(2)
+        return 2
 
     try:
-        closes = fetch_last_20_closes(symbol_pair)
+        z, mean, std, latest = compute_zscore(symbol_pair)
     except RuntimeError as e:
         print(f"Error: {e}", file=sys.stderr)
-        sys.exit(3)
+        return 3
 
-    mean = sum(closes) / 20.0
-    variance = sum((x - mean) ** 2 for x in closes) / 20.0
-    std = math.sqrt(variance)
-    latest = closes[-1]
-    if std > 0:
-        z = (latest - mean) / std
-    else:
-        z = 0.0
+    if not std > 0:
         print("Warning: Standard deviation is zero; price series is flat.", file=sys.stderr)
 
     print(f"Symbol: {input_symbol} | Z-score (last 20 closes, 1m): {z:.6f} | mean={mean:.6f} | std={std:.6f} | latest={latest:.6f} | n=20")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute Z-score of the last 20 1-minute closes for a symbol.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--symbol', help='Trading symbol (e.g., BTC, ETH)')
+    group.add_argument('--symbols', help='Comma-separated trading symbols (e.g., BTC,ETH,SOL), fetched in one process over a shared connection')
+    args = parser.parse_args()
+
+    if args.symbols is not None:
+        symbols = [s.strip() for s in args.symbols.split(',') if s.strip()]
+        if not symbols:
+            parser.error("--symbols must list at least one non-empty symbol.")
+        # Sequential on purpose: every fetch goes through the one shared client, so the
+        # keep-alive connection is reused; a failing symbol does not stop the others
+        sys.exit(max([report_zscore(symbol) for symbol in symbols]))
+
+    if not args.symbol or not isinstance(args.symbol, str) or args.symbol.strip() == "":
+        parser.error("Symbol must be a non-empty string.")
+
+    sys.exit(report_zscore(args.symbol.strip()))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file